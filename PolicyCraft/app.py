@@ -30,33 +30,44 @@ University: Leeds Trinity University
 from dotenv import load_dotenv
 load_dotenv()
 
+def _get_analysis_cached(analysis_id, user_id=None, projection=None):
+    """Fetch an analysis at most once per request, memoised on flask.g (user-scoped when user_id is given)."""
+    cache = g.setdefault('_analysis_cache', {})
+    key = (analysis_id, user_id, tuple(sorted(projection)) if projection else None)
+    if key not in cache:
+        if user_id is None:
+            cache[key] = db_operations.get_analysis_by_id(analysis_id, projection=projection)
+        else:
+            cache[key] = db_operations.get_user_analysis_by_id(user_id, analysis_id, projection=projection)
+    return cache[key]
+
 def _fetch_analysis_for_recommendations(analysis_id):
-    """Fetch analysis by user first, then globally, mirroring logs and test-temporary permission notes."""
-    logger.info("Attempting to get user's analysis...")
-    analysis = db_operations.get_user_analysis_by_id(current_user.id, analysis_id)
-    if analysis:
-        logger.info("Found analysis in user's analyses")
-        logger.info(f"Analysis details - User ID: {analysis.get('user_id')}, Is Baseline: {analysis.get('is_baseline', False)}")
+    """Fetch analysis by id in one query, logging whether it belongs to the user (test-temporary permission notes)."""
+    analysis = _get_analysis_cached(analysis_id, projection=RECOMMENDATION_ANALYSIS_FIELDS)
+    if not analysis:
+        return None
+    if analysis.get('user_id') == current_user.id:
+        logger.debug("Found analysis in user's analyses")
+        logger.debug("Analysis details - User ID: %s, Is Baseline: %s",
+                     analysis.get('user_id'), analysis.get('is_baseline', False))
         return analysis
 
-    logger.warning(f"{ANALYSIS_NOT_FOUND} in user's analyses, trying global lookup...")
-    analysis = db_operations.get_analysis_by_id(analysis_id)
-    if analysis:
-        logger.info("Found analysis in global collection")
-        logger.info(f"Analysis details - ID: {analysis.get('_id')}")
-        logger.info(f"Analysis owner: User ID: {analysis.get('user_id')}, Username: {analysis.get('username')}")
-        logger.info(f"Is baseline: {analysis.get('is_baseline', False)}")
-        logger.info(f"Analysis user_id: {analysis.get('user_id')}, Current user ID: {current_user.id}")
-        logger.info(f"Analysis username: {analysis.get('username')}, Current username: {getattr(current_user, 'username', 'N/A')}")
-        return analysis
-    return None
+    logger.warning(f"{ANALYSIS_NOT_FOUND} in user's analyses, using global match")
+    logger.debug("Analysis details - ID: %s", analysis.get('_id'))
+    logger.debug("Analysis owner: User ID: %s, Username: %s", analysis.get('user_id'), analysis.get('username'))
+    logger.debug("Is baseline: %s", analysis.get('is_baseline', False))
+    logger.debug("Analysis user_id: %s, Current user ID: %s", analysis.get('user_id'), current_user.id)
+    logger.debug("Analysis username: %s, Current username: %s",
+                 analysis.get('username'), getattr(current_user, 'username', 'N/A'))
+    return analysis
 
 def _extract_cleaned_text_with_logging(analysis):
     """Extract cleaned text and log sizes as in original code."""
     text_data = analysis.get('text_data', {})
     cleaned_text = text_data.get('cleaned_text', text_data.get('original_text', ''))
-    logger.info(f"Extracted data - Themes: {len(analysis.get('themes', []))}, Classification: {analysis.get('classification', {})}")
-    logger.info(f"Text data length: {len(cleaned_text) if cleaned_text else 0} chars")
+    logger.debug("Extracted data - Themes: %d, Classification: %s",
+                 len(analysis.get('themes', [])), analysis.get('classification', {}))
+    logger.debug("Text data length: %d chars", len(cleaned_text) if cleaned_text else 0)
     return cleaned_text
 
 def _load_or_generate_recommendations(analysis_id, cleaned_text, themes=None, classification=None):
@@ -70,11 +81,11 @@ def _load_or_generate_recommendations(analysis_id, cleaned_text, themes=None, cl
         stored_recs = db_operations.get_recommendations_by_analysis(current_user.id, analysis_id)
 
         # Run engine to build coverage, sources and narrative
-        engine_package = recommendation_engine.generate_recommendations(
-            themes=themes or [],
-            classification=classification or {},
-            text=cleaned_text,
-            analysis_id=analysis_id,
+        engine_package = _generate_recommendations_cached(
+            themes or [],
+            classification or {},
+            cleaned_text,
+            analysis_id,
         )
 
         if stored_recs:
@@ -161,15 +172,17 @@ def _load_or_generate_recommendations(analysis_id, cleaned_text, themes=None, cl
         logger.error(f"Error generating recommendations: {str(e)}")
         return None
 
-def _get_or_create_analysis_record(filename: str, is_baseline: bool, file_path: str):
-    """Get existing analysis or run new one and return complete data.
-    Returns: extracted_text, cleaned_text, themes, classification, analysis_id
+def _get_or_create_analysis_record(filename: str, file_path: str, existing):
+    """Unpack the existing analysis (from _get_existing_analysis_record) or run a new one.
+    Returns: extracted_text, cleaned_text, themes, classification, and a future resolving
+    to the analysis_id (already resolved for existing records)
     Raises ValueError('no_text') if text extraction failed (maintains existing behaviour).
     """
-    existing = _get_existing_analysis_record(filename, is_baseline)
     if existing:
         themes, classification, cleaned_text, extracted_text, analysis_id = _unpack_existing_analysis(existing)
-        return extracted_text, cleaned_text, themes, classification, analysis_id
+        stored = Future()
+        stored.set_result(analysis_id)
+        return extracted_text, cleaned_text, themes, classification, stored
 
     # Robust path: always attempt fallback extraction and safe downstream steps.
     # Derive a human-friendly university/institution name for placeholder messaging.
@@ -197,8 +210,8 @@ def _get_or_create_analysis_record(filename: str, is_baseline: bool, file_path:
             "source": SOURCE_BASELINE_DEFAULT,
         }
 
-    analysis_id = _store_analysis_results(filename, extracted_text, cleaned_text, themes, classification)
-    return extracted_text, cleaned_text, themes, classification, analysis_id
+    stored = _submit_analysis_store(filename, extracted_text, cleaned_text, themes, classification)
+    return extracted_text, cleaned_text, themes, classification, stored
 
 def _build_basic_export_data(analysis_id, analysis, recommendations, recommendation_package=None):
     """Build the base export data package used by PDF/Word/Excel (without charts)."""
@@ -295,7 +308,6 @@ def _make_binary_response(binary_data: bytes, content_type: str, filename: str):
 
 def _export_binary_via_engine(export_data: dict, analysis_id: str, fmt: str):
     """Common export helper for PDF/Word/Excel. fmt in {'pdf','word','excel'}."""
-    from src.export import ExportEngine
     export_engine = ExportEngine()
     if fmt == 'pdf':
         binary = export_engine.export_to_pdf(export_data)
@@ -335,6 +347,10 @@ def _build_recommendation_data(analysis_id, analysis, themes, classification, re
     logger.info(f"Export view: confidence_factors: {extended.get('confidence_factors')}")
     logger.info(f"Export view: confidence data: {extended.get('confidence')}")
     
+    # Bind the package sections once rather than re-reading them per key
+    recs = recommendation_package.get('recommendations', [])
+    meta = recommendation_package.get('analysis_metadata', {})
+
     # Build the data structure for template
     template_data = {
         'analysis': {
@@ -348,14 +364,14 @@ def _build_recommendation_data(analysis_id, analysis, themes, classification, re
             'analysis_id': analysis_id,
             'themes_count': len(themes)
         },
-        'recommendations': recommendation_package.get('recommendations', []),
+        'recommendations': recs,
         'coverage_analysis': recommendation_package.get('coverage_analysis', {}),
         'gaps': recommendation_package.get('identified_gaps', []),
-        'generated_date': recommendation_package.get('analysis_metadata', {}).get('generated_date', datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
-        'methodology': recommendation_package.get('analysis_metadata', {}).get('methodology', 'Ethical Framework Analysis'),
-        'academic_sources': recommendation_package.get('analysis_metadata', {}).get('academic_sources', []),
+        'generated_date': meta['generated_date'] if 'generated_date' in meta else current_timestamp(),
+        'methodology': meta.get('methodology', 'Ethical Framework Analysis'),
+        'academic_sources': meta.get('academic_sources', []),
         'summary': recommendation_package.get('summary', {}),
-        'total_recommendations': len(recommendation_package.get('recommendations', [])),
+        'total_recommendations': len(recs),
         'narrative': recommendation_package.get('narrative', {})
     }
     
@@ -367,29 +383,6 @@ def _build_recommendation_data(analysis_id, analysis, themes, classification, re
     
     return template_data
 
-    return {
-        'analysis': {
-            'filename': analysis.get('filename', 'Unknown'),
-            'classification': classification.get('classification', 'Unknown'),
-            'confidence': classification.get('confidence', 0),
-            'confidence_pct': conf_pct,
-            'confidence_factors': extended.get('confidence_factors') or extended.get('confidence', {}).get('factors'),
-            'stakeholders': extended.get('stakeholders'),
-            'risk_benefit': extended.get('risk_benefit'),
-            'analysis_id': analysis_id,
-            'themes_count': len(themes)
-        },
-        'recommendations': recommendation_package.get('recommendations', []),
-        'coverage_analysis': recommendation_package.get('coverage_analysis', {}),
-        'gaps': recommendation_package.get('identified_gaps', []),
-        'generated_date': recommendation_package.get('analysis_metadata', {}).get('generated_date', datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
-        'methodology': recommendation_package.get('analysis_metadata', {}).get('methodology', 'Ethical Framework Analysis'),
-        'academic_sources': recommendation_package.get('analysis_metadata', {}).get('academic_sources', []),
-        'summary': recommendation_package.get('summary', {}),
-        'total_recommendations': len(recommendation_package.get('recommendations', [])),
-        'narrative': recommendation_package.get('narrative', {})
-    }
-
 def _store_recommendations_safe(analysis_id, recommendation_package):
     """Store recommendations, logging but not failing flow on errors."""
     try:
@@ -429,23 +422,10 @@ def _fallback_recommendations_response(analysis_id, analysis):
                 'analysis_id': analysis_id,
                 'confidence_pct': conf_pct,
             },
-            'recommendations': [
-                {
-                    'title': 'Policy Review Required',
-                    'description': 'Conduct comprehensive review of AI policy to ensure alignment with current best practices.',
-                    'priority': 'high',
-                    'source': 'Fallback System',
-                    'timeframe': '3-6 months',
-                    'implementation_steps': [
-                        'Review current policy framework',
-                        'Consult with stakeholders',
-                        'Implement evidence-based improvements'
-                    ]
-                }
-            ],
-            'generated_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'recommendations': FALLBACK_RECOMMENDATIONS,
+            'generated_date': current_timestamp(),
             'methodology': 'Basic Template (Fallback)',
-            'total_recommendations': 1,
+            'total_recommendations': len(FALLBACK_RECOMMENDATIONS),
             'error_note': 'Advanced analysis temporarily unavailable'
         }
         flash('Using basic recommendations due to processing error.', 'warning')
@@ -455,13 +435,28 @@ def _fallback_recommendations_response(analysis_id, analysis):
         flash('Error generating recommendations. Please try again.', 'error')
         return redirect(url_for('dashboard'))
 
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, make_response
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, make_response, session, g
 from flask_login import LoginManager, login_required, current_user
 from flask_wtf.csrf import CSRFProtect
+from jinja2 import FileSystemBytecodeCache
 import os
+import re
+import shutil
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
 import logging
-from datetime import datetime
+import atexit
+import hashlib
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import threading
+import time
+import copy
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 
 def validate_dependencies():
     """
@@ -668,18 +663,56 @@ from config import get_config, create_secure_directories
 # Constants for duplicated literals
 DOCX_EXTENSION = '.docx'
 TIMEZONE_SUFFIX = '+00:00'
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+# Analysis fields read by the recommendations and export-recommendation flows
+RECOMMENDATION_ANALYSIS_FIELDS = {
+    'user_id': 1, 'username': 1, 'filename': 1, 'is_baseline': 1,
+    'themes': 1, 'classification': 1,
+    'text_data.cleaned_text': 1, 'text_data.original_text': 1,
+}
+# Shown when recommendation generation fails; read-only because it is shared across requests
+FALLBACK_RECOMMENDATIONS = (
+    MappingProxyType({
+        'title': 'Policy Review Required',
+        'description': 'Conduct comprehensive review of AI policy to ensure alignment with current best practices.',
+        'priority': 'high',
+        'source': 'Fallback System',
+        'timeframe': '3-6 months',
+        'implementation_steps': (
+            'Review current policy framework',
+            'Consult with stakeholders',
+            'Implement evidence-based improvements',
+        ),
+    }),
+)
 BASELINE_PREFIX = '[BASELINE]'
+# Session key holding the id of the user whose baseline copies are known to exist
+SESSION_BASELINES_LOADED = '_baselines_loaded_for'
 ANALYSIS_NOT_FOUND = 'Analysis not found'
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Top-level analysis fields the JSON API lets callers select with ?fields=
+API_ANALYSIS_FIELDS = frozenset({
+    'user_id', 'document_id', 'filename', 'analysis_date', 'username',
+    'text_data', 'themes', 'classification', 'summary',
+})
 NO_RECOMMENDATIONS_FOUND = 'No recommendations found for this analysis'
 # Newly extracted string constants (SonarCloud code smells)
 THEME_AI_ETHICS = 'AI Ethics'
 SOURCE_BASELINE_CREATION = 'Baseline Creation'
 SOURCE_BASELINE_DEFAULT = 'Baseline Creation (Default)'
+# Read-only fallbacks for baselines whose analysis failed; copied before storing
+DEFAULT_BASELINE_CLASSIFICATION = MappingProxyType({
+    "classification": "Moderate",
+    "confidence": 75,
+    "source": SOURCE_BASELINE_DEFAULT
+})
+DEFAULT_BASELINE_THEMES = (MappingProxyType({"name": "Policy", "score": 0.8, "confidence": 75}),)
 # Template constants to avoid duplicated literals
 ABOUT_TEMPLATE = 'about.html'
 PUBLIC_ABOUT_TEMPLATE = 'public/about.html'
 
 from src.nlp.text_processor import TextProcessor
+from src.nlp.text_extraction import ExtractionPool, extract_text_with_fallback
 from src.nlp.theme_extractor import ThemeExtractor
 from src.nlp.policy_classifier import PolicyClassifier
 from src.database.mongo_operations import MongoOperations as DatabaseOperations
@@ -688,6 +721,8 @@ from src.export.export_engine import ExportEngine
 from src.auth.routes import auth_bp
 from src.admin.routes import admin_bp
 from src.database.models import db, User
+from src.utils.validation import validate_recommendation_sources
+from src.web.json_provider import init_json_provider
 from src.literature.literature_engine import LiteratureEngine
 from src.literature.knowledge_manager import KnowledgeBaseManager as KnowledgeManager
 from src.utils.auto_document_manager import AutoDocumentManager
@@ -700,16 +735,59 @@ def clean_baseline_filename(filename):
     if filename.startswith(BASELINE_PREFIX + " "):
         clean_name = filename.replace(BASELINE_PREFIX + " ", "")
         if clean_name.endswith(".pdf"):
-            clean_name = clean_name.replace(".pdf", "")
+            clean_name = clean_name[:-len(".pdf")]
         return clean_name
     return filename
 
+# File extensions and policy suffixes stripped from display names in a single pass
+_NAME_SUFFIX_RE = re.compile(r'\.(?:pdf|docx?|txt)|-ai-policy|_ai_policy')
+
+# Baseline display names mapped back to their clean_dataset files
+BASELINE_FILE_MAPPING = {
+    'University of Oxford': 'oxford-ai-policy.pdf',
+    'University of Cambridge': 'cambridge-ai-policy.pdf',
+    'Imperial College London': 'imperial-ai-policy.docx',
+    'University of Edinburgh': 'edinburgh university-ai-policy.pdf',
+    'Leeds Trinity University': 'leeds trinity university-ai-policy.pdf',
+    'MIT': 'mit-ai-policy.pdf',
+    'Harvard University': 'harvard-ai-policy.pdf',
+    'Stanford University': 'stanford-ai-policy.pdf',
+    'University of Tokyo': 'tokyo-ai-policy.docx',
+    'Jagiellonian University': 'jagiellonian university-ai-policy.pdf',
+    'Belfast University': 'belfast university-ai-policy.pdf',
+    'University of Chicago': 'chicago-ai-policy.docx',
+    'Columbia University': 'columbia-ai-policy.pdf',
+    'Cornell University': 'cornell-ai-policy.docx',
+    'University of Liverpool': 'liverpool policy-ai-policy.pdf'
+}
+CLEAN_DATASET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'policies', 'clean_dataset')
+
+# Keyword mapping to canonical university names; checked in order, first match wins
+UNIVERSITY_KEYWORDS = (
+    ('harvard', 'Harvard University'),
+    ('stanford', 'Stanford University'),
+    ('mit', 'MIT'),
+    ('cambridge', 'University of Cambridge'),
+    ('oxford', 'Oxford University'),
+    ('belfast', 'Belfast University'),
+    ('edinburgh', 'Edinburgh University'),
+    ('columbia', 'Columbia University'),
+    ('cornell', 'Cornell University'),
+    ('chicago', 'University of Chicago'),
+    ('imperial', 'Imperial College London'),
+    ('tokyo', 'University of Tokyo'),
+    ('jagiellonian', 'Jagiellonian University'),
+    ('liverpool', 'University of Liverpool'),
+)
+
+@lru_cache(maxsize=1024)
 def clean_university_name(filename):
     """
     Clean filename to display only the university name without technical prefixes.
     
     This function removes timestamp prefixes and file extensions to present
-    a clean, user-friendly university name for display purposes.
+    a clean, user-friendly university name for display purposes. Results are
+    memoised because templates call it for every row on every render.
     """
     # Remove timestamp prefixes
     if '_' in filename:
@@ -718,15 +796,7 @@ def clean_university_name(filename):
         clean_name = filename
 
     # Remove file extensions and common suffixes
-    clean_name = (
-        clean_name
-        .replace('.pdf', '')
-        .replace(DOCX_EXTENSION, '')
-        .replace('.doc', '')
-        .replace('.txt', '')
-        .replace('-ai-policy', '')
-        .replace('_ai_policy', '')
-    )
+    clean_name = _NAME_SUFFIX_RE.sub('', clean_name)
 
     name_lower = clean_name.lower()
 
@@ -734,25 +804,7 @@ def clean_university_name(filename):
     if 'leeds' in name_lower and 'trinity' in name_lower:
         return 'Leeds Trinity University'
 
-    # Keyword mapping to canonical names
-    keyword_map = [
-        ('harvard', 'Harvard University'),
-        ('stanford', 'Stanford University'),
-        ('mit', 'MIT'),
-        ('cambridge', 'University of Cambridge'),
-        ('oxford', 'Oxford University'),
-        ('belfast', 'Belfast University'),
-        ('edinburgh', 'Edinburgh University'),
-        ('columbia', 'Columbia University'),
-        ('cornell', 'Cornell University'),
-        ('chicago', 'University of Chicago'),
-        ('imperial', 'Imperial College London'),
-        ('tokyo', 'University of Tokyo'),
-        ('jagiellonian', 'Jagiellonian University'),
-        ('liverpool', 'University of Liverpool'),
-    ]
-
-    for keyword, canonical in keyword_map:
+    for keyword, canonical in UNIVERSITY_KEYWORDS:
         if keyword in name_lower:
             return canonical
 
@@ -767,15 +819,9 @@ def clean_filename(filename):
     Removes technical prefixes added during upload process to present
     clean filenames for user interface display.
     """
-    if '_' in filename:
-        parts = filename.split('_')
-        if len(parts) >= 3:
-            clean_name = '_'.join(parts[2:])
-        else:
-            clean_name = filename
-    else:
-        clean_name = filename
-    return clean_name
+    # Split only on the first two separators; underscores in the name are kept
+    parts = filename.split('_', 2)
+    return parts[2] if len(parts) == 3 else filename
 
 def format_british_date(date_str):
     """
@@ -784,28 +830,52 @@ def format_british_date(date_str):
     Converts various date formats to the standardised British format
     for consistent presentation throughout the application interface.
     """
+    if isinstance(date_str, str):
+        return _format_british_date_str(date_str)
     try:
-        from datetime import datetime
-        if isinstance(date_str, str):
-            if 'T' in date_str:
-                dt = datetime.fromisoformat(date_str.replace('Z', TIMEZONE_SUFFIX))
-            else:
-                dt = datetime.strptime(date_str[:19], '%Y-%m-%d %H:%M:%S')
-        else:
-            dt = date_str
-        return dt.strftime('%d/%m/%Y')
+        return date_str.strftime('%d/%m/%Y')
     except Exception:
         return str(date_str)[:10] if len(str(date_str)) > 10 else str(date_str)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/application.log'),
-        logging.StreamHandler()
-    ]
-)
+@lru_cache(maxsize=4096)
+def _format_british_date_str(date_str):
+    """Parse and reformat a date string; memoised as dashboard rows repeat the same dates."""
+    try:
+        if 'T' in date_str:
+            dt = datetime.fromisoformat(date_str.replace('Z', TIMEZONE_SUFFIX))
+        else:
+            dt = datetime.strptime(date_str[:19], DATETIME_FORMAT)
+        return dt.strftime('%d/%m/%Y')
+    except Exception:
+        return date_str[:10] if len(date_str) > 10 else date_str
+
+_timestamp_cache = (None, '')
+
+def current_timestamp():
+    """Return the local time as DATETIME_FORMAT, formatting at most once per second."""
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, text = _timestamp_cache
+    if second != cached_second:
+        # Tuple swap is atomic; a racing thread at worst formats the same second twice
+        text = datetime.fromtimestamp(second).strftime(DATETIME_FORMAT)
+        _timestamp_cache = (second, text)
+    return text
+
+# Configure logging: request threads only enqueue records; a listener thread
+# writes them to the log file and console
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_log_handlers = [logging.FileHandler('logs/application.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter(LOG_FORMAT))
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_queue_handler = QueueHandler(_log_queue)
+# Message only: the listener's handlers apply LOG_FORMAT
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
 def create_app():
@@ -834,6 +904,15 @@ def create_app():
     config_env = os.environ.get('FLASK_ENV', 'development')
     config_obj = get_config(config_env)
     app.config.from_object(config_obj)
+    # Upload folder is created once here rather than checked on every upload
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+
+    # Serve jsonify through orjson when it is installed; ObjectIds serialise as strings
+    init_json_provider(app)
+
+    # Persist compiled template bytecode so restarted workers skip the parse step
+    if app.config.get('JINJA_BYTECODE_CACHE'):
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
     
     # Initialise extensions
     db.init_app(app)
@@ -876,13 +955,23 @@ def create_app():
         return {'current_user': current_user}
     
     # Define core routes on this app instance so tests using a fresh app have them
+    anonymous_index = {}
+
     @app.route('/')
     def index():
         """
         Landing page route for PolicyCraft application.
+
+        The anonymous variant is identical for every visitor, so it is rendered
+        once and reused unless there are flashed messages to show.
         """
         logger.info("Landing page accessed")
-        return render_template("index.html")
+        if app.debug or current_user.is_authenticated or session.get('is_admin') or session.get('_flashes'):
+            return render_template("index.html")
+        html = anonymous_index.get('html')
+        if html is None:
+            html = anonymous_index['html'] = render_template("index.html")
+        return html
 
     @app.route('/about')
     def about():
@@ -903,25 +992,42 @@ def create_app():
     
     return app
 
+def _warm_template_cache(app):
+    """Compile every template at startup so first requests do not pay for it."""
+    env = app.jinja_env
+    for name in env.list_templates(extensions=['html']):
+        try:
+            env.get_template(name)
+        except Exception as e:
+            logger.warning(f"Template precompile skipped for {name}: {e}")
+
 # Create Flask app and initialize modules
 app = create_app()
 
  
 # Lazy initialisation wrappers to avoid heavy startup costs
 class _LazyObject:
-    """Defers creation of the underlying object until first attribute access."""
+    """Defers creation of the underlying object until first attribute access.
+
+    Creation is guarded by a lock so that concurrent first requests in a threaded
+    server build a single instance (e.g. one spaCy pipeline) rather than one each.
+    """
     def __init__(self, factory, name: str):
         self._factory = factory
         self._obj = None
         self._name = name
+        self._lock = threading.Lock()
 
     def _get(self):
-        if self._obj is None:
-            import time as _time
-            start = _time.time()
-            self._obj = self._factory()
-            logger.info(f"Initialised {self._name} in {_time.time()-start:.3f}s")
-        return self._obj
+        obj = self._obj
+        if obj is None:
+            with self._lock:
+                obj = self._obj
+                if obj is None:
+                    start = time.perf_counter()
+                    obj = self._obj = self._factory()
+                    logger.info(f"Initialised {self._name} in {time.perf_counter()-start:.3f}s")
+        return obj
 
     def __getattr__(self, item):
         return getattr(self._get(), item)
@@ -935,6 +1041,83 @@ db_operations = _LazyObject(lambda: DatabaseOperations(uri="mongodb://localhost:
 chart_generator = _LazyObject(lambda: ChartGenerator(), "ChartGenerator")
 recommendation_engine = _LazyObject(lambda: RecommendationEngine(knowledge_base_path=knowledge_base_path), "RecommendationEngine")
 
+# Shared pool for I/O-bound batch work (Mongo writes, chart rendering) so it
+# overlaps with CPU-bound NLP on the request thread. MongoClient is thread-safe.
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="policycraft-io")
+
+# Missing clean_dataset baselines are analysed off the request thread. One worker
+# runs backfills one at a time (request threads still use the same NLP singletons
+# meanwhile); the pending set stops several dashboard hits from queueing the same
+# file twice.
+_baseline_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="policycraft-baselines")
+_baseline_backfill_pending = set()
+_baseline_backfill_lock = threading.Lock()
+# Files a backfill has already attempted, mapped to the time.monotonic() after which they may be
+# queued again. Stops a baseline that keeps failing to store or resolve from being re-analysed
+# on every dashboard load.
+BASELINE_BACKFILL_RETRY_SECONDS = 600
+_baseline_backfill_retry_after = {}
+
+# PDF/DOCX parsing for baseline backfills and batch analysis is CPU-bound, so it
+# runs in small process pools. Workers come from forkserver/spawn rather than forking
+# this threaded process. A baseline slower than the timeout is extracted inline instead;
+# batch analysis has its own pool, so requests never queue behind a backfill, and a
+# shorter timeout after which the document gets placeholder text.
+BASELINE_EXTRACTION_WORKERS = min(4, os.cpu_count() or 1)
+BASELINE_EXTRACTION_TIMEOUT = 120
+BATCH_EXTRACTION_TIMEOUT = 30
+_extraction_pool = ExtractionPool(max_workers=BASELINE_EXTRACTION_WORKERS, timeout=BASELINE_EXTRACTION_TIMEOUT)
+_batch_extraction_pool = ExtractionPool(max_workers=BASELINE_EXTRACTION_WORKERS, timeout=BATCH_EXTRACTION_TIMEOUT)
+
+# Recent recommendation packages keyed by (analysis_id, input digest); the engine
+# is the slowest step of the recommendations, export and validation routes
+RECOMMENDATION_CACHE_SIZE = 256
+RECOMMENDATION_CACHE_TTL = 3600
+_recommendation_cache = OrderedDict()
+_recommendation_cache_lock = threading.Lock()
+
+# Cleaned text and themes keyed by (stage, input digest), so re-uploads of the same
+# document skip the spaCy passes
+NLP_CACHE_SIZE = 64
+_nlp_cache = OrderedDict()
+_nlp_cache_lock = threading.Lock()
+
+
+def _generate_recommendations_cached(themes, classification, text, analysis_id):
+    """Run the recommendation engine, reusing a recent package for identical inputs.
+
+    Callers receive a deep copy, so merging stored recommendations into it does
+    not alter the cached package. A reused package gets a fresh generated_date.
+    """
+    digest = hashlib.blake2b(repr((themes, classification, text)).encode('utf-8'), digest_size=16).digest()
+    key = (analysis_id, digest)
+    now = time.monotonic()
+    cached = None
+    with _recommendation_cache_lock:
+        entry = _recommendation_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _recommendation_cache.move_to_end(key)
+            cached = copy.deepcopy(entry[1])
+    if cached is not None:
+        metadata = cached.get('analysis_metadata')
+        if isinstance(metadata, dict):
+            # Same format as RecommendationEngine.generate_recommendations
+            metadata['generated_date'] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        return cached
+
+    package = recommendation_engine.generate_recommendations(
+        themes=themes,
+        classification=classification,
+        text=text,
+        analysis_id=analysis_id,
+    )
+    with _recommendation_cache_lock:
+        _recommendation_cache[key] = (now + RECOMMENDATION_CACHE_TTL, package)
+        _recommendation_cache.move_to_end(key)
+        while len(_recommendation_cache) > RECOMMENDATION_CACHE_SIZE:
+            _recommendation_cache.popitem(last=False)
+    return copy.deepcopy(package)
+
 
 def allowed_file(filename):
     """
@@ -943,8 +1126,8 @@ def allowed_file(filename):
     Validates file type against configured allowed extensions
     to ensure only supported document formats are processed.
     """
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in app.config['ALLOWED_EXTENSIONS']
 
 def create_upload_folder():
     """
@@ -953,25 +1136,10 @@ def create_upload_folder():
     Ensures the designated upload directory exists for storing
     user-uploaded policy documents.
     """
-    upload_folder = app.config['UPLOAD_FOLDER']
-    if not os.path.exists(upload_folder):
-        os.makedirs(upload_folder)
-        logger.info(f"Created upload folder: {upload_folder}")
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 # Main application routes
 
-def _to_epoch(val):
-    """Convert supported date formats to POSIX timestamp for consistent sorting."""
-    try:
-        if isinstance(val, datetime):
-            return val.replace(tzinfo=None).timestamp()
-        if isinstance(val, str):
-            dt = datetime.fromisoformat(val.replace('Z', TIMEZONE_SUFFIX))
-            return dt.replace(tzinfo=None).timestamp()
-    except Exception:
-        pass
-    return 0
-
 def _get_uploaded_files_from_request(req):
     """Extract list of uploaded files from Flask request supporting multiple field names."""
     files = []
@@ -987,30 +1155,58 @@ def _get_uploaded_files_from_request(req):
     # Filter out empty filenames
     return [f for f in files if getattr(f, 'filename', '')]
 
+def _remove_partial_upload(dest_path):
+    """Delete a partially written upload, e.g. after the client disconnected mid-stream."""
+    try:
+        os.remove(dest_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove partial upload {dest_path}: {e}")
+
+def _save_upload_stream(stream, original_name, upload_folder):
+    """Validate the name and stream one upload to disk. Returns (success_dict, None) or (None, failure_dict)."""
+    if not original_name:
+        return None, {'filename': original_name or 'unknown', 'reason': 'Empty filename'}
+    if not allowed_file(original_name):
+        return None, {'filename': original_name, 'reason': 'Disallowed file type'}
+    safe_name = secure_filename(original_name)
+    timestamp = datetime.now().strftime('%Y%m%d%H%M%S%f')
+    unique_name = f"{current_user.id}_{timestamp}_{safe_name}"
+    dest_path = os.path.join(upload_folder, unique_name)
+    try:
+        # Stream to disk in 1 MiB chunks and take the size from the write offset
+        with open(dest_path, 'wb') as dst:
+            shutil.copyfileobj(stream, dst, length=UPLOAD_CHUNK_SIZE)
+            size = dst.tell()
+    except RequestEntityTooLarge:
+        # Let Flask answer 413 rather than reporting a generic save failure
+        _remove_partial_upload(dest_path)
+        raise
+    except Exception as e:
+        logger.error(f"Failed to save uploaded file {original_name}: {e}")
+        _remove_partial_upload(dest_path)
+        return None, {'filename': original_name, 'reason': 'Save failed'}
+    logger.info(f"Saved uploaded file: {dest_path} ({size} bytes)")
+    # Only complete files are recorded
+    try:
+        db_operations.record_uploaded_file(current_user.id, unique_name, dest_path, size)
+    except Exception as e:
+        # Deletion falls back to probing the upload folder for unrecorded files
+        logger.warning(f"Could not record uploaded file {unique_name}: {e}")
+    return {'original': original_name, 'unique': unique_name, 'size': size}, None
+
 def _process_uploaded_files(uploaded_files):
     """Validate and save uploaded files. Returns (successful_uploads, failed_uploads)."""
-    create_upload_folder()
+    upload_folder = app.config['UPLOAD_FOLDER']
     successful = []
     failed = []
     for f in uploaded_files:
-        original_name = f.filename
-        if not original_name:
-            failed.append({'filename': original_name or 'unknown', 'reason': 'Empty filename'})
-            continue
-        if not allowed_file(original_name):
-            failed.append({'filename': original_name, 'reason': 'Disallowed file type'})
-            continue
-        try:
-            safe_name = secure_filename(original_name)
-            timestamp = datetime.now().strftime('%Y%m%d%H%M%S%f')
-            unique_name = f"{current_user.id}_{timestamp}_{safe_name}"
-            dest_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_name)
-            f.save(dest_path)
-            logger.info(f"Saved uploaded file: {dest_path}")
-            successful.append({'original': original_name, 'unique': unique_name})
-        except Exception as e:
-            logger.error(f"Failed to save uploaded file {original_name}: {e}")
-            failed.append({'filename': original_name, 'reason': 'Save failed'})
+        saved, failure = _save_upload_stream(f.stream, f.filename, upload_folder)
+        if saved:
+            successful.append(saved)
+        else:
+            failed.append(failure)
     return successful, failed
 
 def _parse_batch_file_list(files_param: str):
@@ -1024,179 +1220,219 @@ def _authorize_batch_files(file_list):
     prefix = f"{current_user.id}_"
     return all(name.startswith(prefix) for name in file_list)
 
-def _process_single_batch_file(filename: str):
-    """Process a single uploaded user file; returns (result_dict, ok_bool)."""
+def _batch_university_guess(filename: str) -> str:
+    """Guess the institution name used in placeholder text for a batch file."""
+    return filename.split('-')[0].replace('university', '').strip().title() or 'User Institution'
+
+def _extract_batch_texts(file_list):
+    """Extract the batch's files in the batch extraction pool; returns {filename: text}.
+
+    Files left out are extracted inline by _load_batch_file_text; a file that timed out
+    comes back as placeholder text so the request does not wait on it twice.
+    """
+    upload_folder = app.config['UPLOAD_FOLDER']
+    files = [f for f in file_list if os.path.exists(os.path.join(upload_folder, f))]
     try:
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        if not os.path.exists(file_path):
-            logger.error(f"Batch: file not found: {file_path}")
-            return {'filename': filename, 'error': 'File not found'}, False
+        texts = _extract_texts_parallel(_batch_extraction_pool,
+                                        [os.path.join(upload_folder, f) for f in files],
+                                        [_batch_university_guess(f) for f in files],
+                                        placeholder_on_timeout=True)
+    except Exception as e:
+        logger.warning(f"Batch: Parallel extraction failed, extracting inline: {e}")
+        return {}
+    return {f: text for f, text in zip(files, texts) if text} if texts else {}
 
-        # Robust extraction path (mirrors single-analysis behaviour)
-        uni_guess = filename.split('-')[0].replace('university', '').strip().title() or 'User Institution'
-        try:
-            extracted_text = _extract_text_with_fallback(file_path, uni_guess)
-            cleaned_text = _clean_text_safe(extracted_text, filename)
-            themes = _extract_themes_safe(cleaned_text, filename)
-            classification = _classify_policy_safe(cleaned_text, filename)
-        except Exception as e:
-            logger.error(f"Batch: robust extraction failed for {filename}: {e}")
-            extracted_text = (
-                f"AI Policy document from {uni_guess}. This is a placeholder text as the original document "
-                f"could not be processed due to: {e}"
-            )
-            cleaned_text = extracted_text
-            themes = [
-                {"name": "Policy", "score": 0.8, "confidence": 75},
-                {"name": THEME_AI_ETHICS, "score": 0.7, "confidence": 70},
-            ]
-            classification = {
-                "classification": "Moderate",
-                "confidence": 75,
-                "source": SOURCE_BASELINE_DEFAULT,
-            }
+def _load_batch_file_text(filename: str, extracted_text: str = None):
+    """Extract and clean one uploaded batch file; returns (extracted, cleaned) or None if missing."""
+    file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    if not os.path.exists(file_path):
+        logger.error(f"Batch: file not found: {file_path}")
+        return None
 
-        analysis_id = _store_analysis_results(filename, extracted_text, cleaned_text, themes, classification)
-        charts, text_stats, theme_summary, classification_details = _generate_analysis_derivatives(cleaned_text, themes, classification)
+    # Robust extraction path (mirrors single-analysis behaviour)
+    uni_guess = _batch_university_guess(filename)
+    try:
+        extracted_text = extracted_text or _extract_text_with_fallback(file_path, uni_guess)
+        cleaned_text = _clean_text_safe(extracted_text, filename)
+    except Exception as e:
+        logger.error(f"Batch: robust extraction failed for {filename}: {e}")
+        extracted_text = (
+            f"AI Policy document from {uni_guess}. This is a placeholder text as the original document "
+            f"could not be processed due to: {e}"
+        )
+        cleaned_text = extracted_text
+    return extracted_text, cleaned_text
+
+def _extract_themes_batch_safe(cleaned_texts, filenames):
+    """Extract themes for all batch texts in one spaCy pass, with per-file defaults on failure.
+
+    Texts whose themes are already cached are left out of the spaCy pass.
+    """
+    try:
+        keys = [_nlp_cache_key('themes', text) for text in cleaned_texts]
+        batch_themes = [_nlp_cache_get(key) for key in keys]
+        misses = [i for i, themes in enumerate(batch_themes) if themes is None]
+        if misses:
+            fresh = theme_extractor.extract_themes_batch([cleaned_texts[i] for i in misses])
+            for i, themes in zip(misses, fresh):
+                _nlp_cache_put(keys[i], themes)
+                batch_themes[i] = copy.deepcopy(themes)
+    except Exception as e:
+        logger.error(f"Batch: batched theme extraction failed, falling back per file: {e}")
+        return [_extract_themes_safe(text, name) for text, name in zip(cleaned_texts, filenames)]
+
+    for name, themes in zip(filenames, batch_themes):
+        logger.info(f"Batch: Extracted {len(themes)} themes from {name}")
+    return [themes or _default_themes() for themes in batch_themes]
+
+def _collect_batch_file_result(filename: str, extracted_text: str, cleaned_text: str, themes, classification,
+                               chart_future, analysis_id):
+    """Wait for one file's queued charts and build its results; returns (result_dict, ok_bool)."""
+    try:
+        if analysis_id is None:
+            raise RuntimeError('Analysis could not be stored')
+        charts = chart_future.result()
+        text_stats, theme_summary, classification_details = _generate_text_derivatives(cleaned_text, themes)
         result_payload = _build_results_payload(filename, analysis_id, themes, classification, charts,
                                                 text_stats, theme_summary, classification_details,
                                                 extracted_text, cleaned_text)
         # Add minimal flags for batch UI
         result_payload['ok'] = True
+        result_payload['status'] = 'success'
+        result_payload['original_filename'] = clean_filename(filename)
         return result_payload, True
     except Exception as e:
         logger.error(f"Batch: error processing {filename}: {e}")
-        return {'filename': filename, 'error': str(e)}, False
+        return _batch_error_result(filename, str(e)), False
 
-def _summarize_batch_results(file_list, successful_analyses, failed_analyses):
+def _batch_error_result(filename: str, error: str) -> dict:
+    """Result entry for a batch file that could not be analysed."""
+    return {'filename': filename, 'original_filename': clean_filename(filename),
+            'status': 'error', 'error': error}
+
+def _summarize_batch_results(file_list, successful_analyses, failed_analyses, tally=None):
     """Create a summary dict for batch analysis template."""
     total = len(file_list)
+    tally = tally or _new_batch_tally()
     return {
         'total_files': total,
         'successful': successful_analyses,
         'failed': failed_analyses,
-        'success_rate': round((successful_analyses / total) * 100, 2) if total else 0.0
+        'success_rate': round((successful_analyses / total) * 100, 2) if total else 0.0,
+        'avg_confidence': tally['confidence_sum'] / successful_analyses if successful_analyses else 0,
+        'classification_summary': dict(tally['classifications']),
+        'theme_summary': dict(tally['themes'].most_common(10))
     }
 
+def _new_batch_tally():
+    """Running theme/classification/confidence totals, fed as batch results are collected."""
+    return {'themes': Counter(), 'classifications': Counter(), 'confidence_sum': 0.0}
+
+def _update_batch_tally(tally, themes, classification):
+    """Add one successful file's top themes and classification to the running tally."""
+    tally['themes'].update(t.get('name', 'Unknown') for t in (themes or [])[:5] if isinstance(t, dict))
+    if isinstance(classification, dict):
+        tally['classifications'][classification.get('classification', 'Unknown')] += 1
+        try:
+            tally['confidence_sum'] += float(classification.get('confidence', 0) or 0)
+        except (TypeError, ValueError):
+            pass
+
 def _process_batch_files(file_list):
-    """Process the list of files in batch mode and return (results, ok_count, fail_count)."""
-    batch_results = []
+    """Process the list of files in batch mode and return (results, ok_count, fail_count, tally)."""
+    batch_results = [None] * len(file_list)
     successful_analyses = 0
     failed_analyses = 0
+    tally = _new_batch_tally()
+
+    # Pass 1: extract every file (in parallel processes where available) and clean it,
+    # so themes can be batched through spaCy
+    extracted_texts = _extract_batch_texts(file_list)
+    loaded = []
+    for index, filename in enumerate(file_list):
+        texts = _load_batch_file_text(filename, extracted_texts.get(filename))
+        if texts is None:
+            batch_results[index] = _batch_error_result(filename, 'File not found')
+            failed_analyses += 1
+        else:
+            loaded.append((index, filename) + texts)
+
+    # Pass 2: one nlp.pipe call for all themes, then per-file classification; each
+    # file's charts run on the I/O pool while the next file is classified
+    filenames = [item[1] for item in loaded]
+    batch_themes = _extract_themes_batch_safe([item[3] for item in loaded], filenames)
+    user_id, username = current_user.id, getattr(current_user, 'username', None)
+    pending = []
+    entries = []
+    for (index, filename, extracted_text, cleaned_text), themes in zip(loaded, batch_themes):
+        classification = _classify_policy_safe(cleaned_text, filename)
+        chart_future = _io_pool.submit(chart_generator.generate_analysis_charts, themes, classification, cleaned_text)
+        entries.append({'user_id': user_id, 'filename': filename, 'original_text': extracted_text,
+                        'cleaned_text': cleaned_text, 'themes': themes, 'classification': classification,
+                        'username': username})
+        pending.append((index, filename, extracted_text, cleaned_text, themes, classification, chart_future))
+
+    # One bulk write stores the whole batch while the last charts are still rendering;
+    # files whose write failed come back with a None ID and are reported individually
+    try:
+        analysis_ids = db_operations.store_user_analyses_bulk(entries)
+    except Exception as e:
+        logger.error(f"Batch: storing analyses failed: {e}")
+        analysis_ids = [None] * len(entries)
 
-    for filename in file_list:
-        result, ok = _process_single_batch_file(filename)
-        batch_results.append(result)
+    # Pass 3: collect results in submission order
+    for (index, *file_state), analysis_id in zip(pending, analysis_ids):
+        result, ok = _collect_batch_file_result(*file_state, analysis_id)
+        batch_results[index] = result
         if ok:
             successful_analyses += 1
+            _update_batch_tally(tally, file_state[3], file_state[4])
         else:
             failed_analyses += 1
 
-    return batch_results, successful_analyses, failed_analyses
-
-def _combine_stats(stats1, stats2):
-    """Combine two sets of statistics with weighted averaging."""
-    total1 = stats1.get('total', 0)
-    total2 = stats2.get('total', 0)
-    total = total1 + total2
-    
-    if total == 0:
-        return {
-            'total': 0,
-            'avg_confidence': 0,
-            'avg_themes_per_analysis': 0
-        }
-    
-    # Calculate weighted average for confidence and themes
-    conf1 = (stats1.get('avg_confidence', 0) or 0) * total1
-    conf2 = (stats2.get('avg_confidence', 0) or 0) * total2
-    
-    themes1 = (stats1.get('avg_themes_per_analysis', 0) or 0) * total1
-    themes2 = (stats2.get('avg_themes_per_analysis', 0) or 0) * total2
-    
-    return {
-        'total': total,
-        'avg_confidence': round((conf1 + conf2) / total, 1) if total > 0 else 0,
-        'avg_themes_per_analysis': round((themes1 + themes2) / total, 1) if total > 0 else 0
-    }
+    return batch_results, successful_analyses, failed_analyses, tally
 
 def _extract_text_with_fallback(file_path: str, university_name: str) -> str:
     """Extract text with size checks and fallbacks for PDF/DOCX. Returns non-empty text (may be placeholder)."""
-    try:
-        if not os.path.exists(file_path):
-            logger.error(f"Dashboard: File does not exist: {file_path}")
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        file_size = os.path.getsize(file_path)
-        if file_size == 0:
-            logger.warning(f"Dashboard: Empty file detected: {file_path} (0 bytes)")
-            raise ValueError(f"Empty file: {file_path}")
-
-        logger.info(f"Dashboard: Attempting to extract text from {file_path} ({file_size} bytes)")
-        extracted_text = text_processor.extract_text_from_file(file_path)
-        text_length = len(extracted_text) if extracted_text else 0
-        logger.info(f"Dashboard: Extracted {text_length} characters from {file_path}")
-
-        if not extracted_text or text_length < 50:
-            logger.warning(f"Dashboard: Insufficient text extracted from {file_path} ({text_length} chars), attempting fallback extraction")
-            lower = file_path.lower()
-            if lower.endswith('.pdf'):
-                extracted_text = _fallback_extract_pdf(file_path, extracted_text)
-            else:
-                extracted_text = _fallback_extract_docx(file_path, extracted_text)
-
-        return _ensure_minimal_text(extracted_text, file_path, university_name)
-    except Exception as e:
-        logger.error(f"Dashboard: Text extraction failed for {file_path}: {e}")
-        return (
-            f"AI Policy document from {university_name}. This is a placeholder text as the original document "
-            f"could not be processed due to: {e}"
-        )
-
-def _fallback_extract_pdf(file_path: str, current_text: str) -> str:
-    """Fallback extraction for PDF using pdfplumber (without hard global dependencies)."""
-    try:
-        import pdfplumber
-        with pdfplumber.open(file_path) as pdf:
-            fb_text = "".join((page.extract_text() or "") + "\n" for page in pdf.pages)
-        if fb_text and len(fb_text) > (len(current_text) if current_text else 0):
-            logger.info(f"Dashboard: Fallback PDF extraction successful, got {len(fb_text)} characters")
-            return fb_text
-    except Exception as e:
-        logger.warning(f"Dashboard: PDF fallback extraction failed: {e}")
-    return current_text
-
-def _fallback_extract_docx(file_path: str, current_text: str) -> str:
-    """Fallback extraction for DOCX/DOC using python-docx (Document)."""
-    lower = file_path.lower()
-    doc_exts = (DOCX_EXTENSION, '.doc') if 'DOCX_EXTENSION' in globals() else ('.docx', '.doc')
-    if not lower.endswith(doc_exts):
-        return current_text
-    try:
-        from docx import Document
-        doc = Document(file_path)
-        fb_text = "\n".join([para.text for para in doc.paragraphs if para.text])
-        if fb_text and len(fb_text) > (len(current_text) if current_text else 0):
-            logger.info(f"Dashboard: Fallback DOCX extraction successful, got {len(fb_text)} characters")
-            return fb_text
-    except Exception as e:
-        logger.warning(f"Dashboard: DOCX fallback extraction failed: {e}")
-    return current_text
-
-def _ensure_minimal_text(extracted_text: str, file_path: str, university_name: str) -> str:
-    """Ensure minimal placeholder text if extraction fails or is too short."""
-    if not extracted_text or len(extracted_text) < 20:
-        logger.warning(f"Dashboard: Using minimal placeholder text for {file_path}")
-        return (
-            f"AI Policy document from {university_name}. This is a placeholder text as the original document "
-            f"could not be fully processed."
-        )
-    return extracted_text
+    return extract_text_with_fallback(file_path, university_name, text_processor)
+
+def _nlp_cache_key(stage, text):
+    """Cache key for one NLP stage over text: the stage name plus a digest of the text."""
+    return stage, hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=16).digest()
+
+def _nlp_cache_get(key):
+    """Return a copy of the cached result for key, or None on a miss."""
+    with _nlp_cache_lock:
+        if key not in _nlp_cache:
+            return None
+        _nlp_cache.move_to_end(key)
+        return copy.deepcopy(_nlp_cache[key])
+
+def _nlp_cache_put(key, result):
+    """Cache result under key, evicting the least recently used entries."""
+    with _nlp_cache_lock:
+        _nlp_cache[key] = result
+        _nlp_cache.move_to_end(key)
+        while len(_nlp_cache) > NLP_CACHE_SIZE:
+            _nlp_cache.popitem(last=False)
+
+def _nlp_cached(stage, text, compute):
+    """Return compute(text), reusing the result for identical input text.
+
+    Callers receive a deep copy, so mutating themes does not alter the cached value.
+    """
+    key = _nlp_cache_key(stage, text)
+    cached = _nlp_cache_get(key)
+    if cached is not None:
+        return cached
+    result = compute(text)
+    _nlp_cache_put(key, result)
+    return copy.deepcopy(result)
 
 def _clean_text_safe(extracted_text: str, missing_file: str) -> str:
     """Clean text with fallback to original on error."""
     try:
-        cleaned = text_processor.clean_text(extracted_text)
+        cleaned = _nlp_cached('clean', extracted_text, text_processor.clean_text)
         logger.info(f"Dashboard: Cleaned text for {missing_file}, now {len(cleaned)} characters")
         return cleaned
     except Exception as e:
@@ -1207,23 +1443,27 @@ def _clean_text_safe(extracted_text: str, missing_file: str) -> str:
 def _extract_themes_safe(cleaned_text: str, missing_file: str):
     """Extract themes with sensible defaults on error/empty result."""
     try:
-        themes = theme_extractor.extract_themes(cleaned_text)
+        themes = _nlp_cached('themes', cleaned_text, theme_extractor.extract_themes)
         logger.info(f"Dashboard: Extracted {len(themes) if themes else 0} themes from {missing_file}")
         if not themes:
             raise ValueError("No themes extracted")
         return themes
     except Exception as e:
         logger.error(f"Dashboard: Theme extraction failed for {missing_file}: {e}")
-        return [
-            {"name": "Policy", "score": 0.8, "confidence": 75},
-            {"name": THEME_AI_ETHICS, "score": 0.7, "confidence": 70},
-            {"name": "Guidelines", "score": 0.6, "confidence": 65}
-        ]
+        return _default_themes()
+
+def _default_themes():
+    """Fallback themes used when extraction fails or finds nothing."""
+    return [
+        {"name": "Policy", "score": 0.8, "confidence": 75},
+        {"name": THEME_AI_ETHICS, "score": 0.7, "confidence": 70},
+        {"name": "Guidelines", "score": 0.6, "confidence": 65}
+    ]
 
 def _classify_policy_safe(cleaned_text: str, missing_file: str) -> dict:
     """Classify text and normalize to dict; fall back to defaults on error."""
     try:
-        classification = policy_classifier.classify_policy(cleaned_text)
+        classification = _nlp_cached('classify', cleaned_text, policy_classifier.classify_policy)
         if isinstance(classification, str):
             return {
                 "classification": _standardize_classification(classification),
@@ -1239,11 +1479,7 @@ def _classify_policy_safe(cleaned_text: str, missing_file: str) -> dict:
         logger.warning(f"Dashboard: Unexpected classification format for {missing_file}: {classification}")
     except Exception as e:
         logger.error(f"Dashboard: Classification failed for {missing_file}: {e}")
-    return {
-        "classification": "Moderate",
-        "confidence": 75,
-        "source": SOURCE_BASELINE_DEFAULT
-    }
+    return dict(DEFAULT_BASELINE_CLASSIFICATION)
 
 def _ensure_defaults_for_storage(extracted_text: str, cleaned_text: str, themes, classification: dict, university_name: str):
     """Ensure default values for storing the baseline analysis (without changing behaviour)."""
@@ -1252,171 +1488,55 @@ def _ensure_defaults_for_storage(extracted_text: str, cleaned_text: str, themes,
     if not cleaned_text:
         cleaned_text = extracted_text
     if not themes:
-        themes = [{"name": "Policy", "score": 0.8, "confidence": 75}]
+        themes = [dict(theme) for theme in DEFAULT_BASELINE_THEMES]
     if not classification or not isinstance(classification, dict):
-        classification = {
-            "classification": "Moderate",
-            "confidence": 75,
-            "source": SOURCE_BASELINE_DEFAULT
-        }
+        classification = dict(DEFAULT_BASELINE_CLASSIFICATION)
     return extracted_text, cleaned_text, themes, classification
 
-def _prepare_storage_metadata(missing_file: str, extracted_text: str) -> dict:
-    """Build storage metadata consistent with the existing format."""
-    return {
-        "source_file": missing_file,
-        "extraction_method": "dashboard_baseline_creation",
-        "creation_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "text_length": len(extracted_text) if extracted_text else 0,
-        "is_baseline": True
-    }
+def _is_auxiliary_dataset_file(missing_file):
+    """Check for helper files in clean_dataset that are not policies."""
+    return 'guidance' in missing_file.lower() or missing_file == 'dataset_info.md'
+
+def _baseline_university_name(missing_file):
+    """Derive the university display name from a clean_dataset filename."""
+    university_name = missing_file.split('-')[0].replace('university', '').strip().title()
+    if not university_name:
+        university_name = missing_file.split('.')[0].replace('university', '').strip().title()
+    return university_name
+
+def _analyse_baseline_file(clean_dataset_dir, missing_file, extracted_text=None):
+    """Analyse one clean_dataset file; returns storage fields for the baseline, or None to skip it."""
+    # Skip auxiliary/helper files
+    if _is_auxiliary_dataset_file(missing_file):
+        return None
 
-def _build_placeholder_analysis(missing_file: str,
-                                baseline_filename: str,
-                                university_name: str,
-                                classification: dict,
-                                themes,
-                                extracted_text: str,
-                                cleaned_text: str,
-                                store_error: Exception) -> dict:
-    """Build an analysis placeholder in case of a storage error, consistent with the current format."""
+    file_path = os.path.join(clean_dataset_dir, missing_file)
+    if not os.path.exists(file_path):
+        logger.error(f"Dashboard: Missing file not found: {file_path}")
+        return None
+
+    university_name = _baseline_university_name(missing_file)
+    baseline_filename = f"{BASELINE_PREFIX} {university_name}"
+    logger.info(f"Dashboard: Creating baseline analysis for {missing_file} as '{baseline_filename}'")
+
+    extracted_text = extracted_text or _extract_text_with_fallback(file_path, university_name)
+    cleaned_text = _clean_text_safe(extracted_text, missing_file)
+    themes = _extract_themes_safe(cleaned_text, missing_file)
+    classification = _classify_policy_safe(cleaned_text, missing_file)
+
+    extracted_text, cleaned_text, themes, classification = _ensure_defaults_for_storage(
+        extracted_text, cleaned_text, themes, classification, university_name
+    )
     return {
-        '_id': f"placeholder_{missing_file.replace('.', '_')}",
-        'filename': baseline_filename,
-        'document_id': missing_file,
-        'title': f"Policy from {university_name}",
-        'analysis_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         'user_id': -1,
-        'is_user_analysis': False,
-        'is_baseline': True,
-        'classification': classification,
-        'score': 50,
+        'filename': baseline_filename,
+        'original_text': extracted_text,
+        'cleaned_text': cleaned_text,
         'themes': themes,
-        'summary': f"This is a placeholder for {missing_file}. Storage error: {store_error}",
-        'text_data': {
-            'original_text': (extracted_text or '')[:1000] if extracted_text else "No text extracted",
-            'cleaned_text': (cleaned_text or '')[:1000] if cleaned_text else "No cleaned text",
-            'text_length': len(extracted_text) if extracted_text else 0
-        }
+        'classification': classification,
+        'document_id': missing_file,
     }
 
-def _store_baseline_or_placeholder(analyses_by_filename: dict,
-                                   missing_file: str,
-                                   baseline_filename: str,
-                                   extracted_text: str,
-                                   cleaned_text: str,
-                                   themes,
-                                   classification: dict,
-                                   university_name: str) -> None:
-    """Store baseline analysis or create a placeholder on failure; updates analyses_by_filename in-place."""
-    try:
-        extracted_text, cleaned_text, themes, classification = _ensure_defaults_for_storage(
-            extracted_text, cleaned_text, themes, classification, university_name
-        )
-
-        metadata = _prepare_storage_metadata(missing_file, extracted_text)
-
-        logger.info(f"Dashboard: Storing baseline analysis for {missing_file} with {len(extracted_text)} chars of text")
-        analysis_id = db_operations.store_user_analysis_results(
-            user_id=-1,
-            filename=baseline_filename,
-            original_text=extracted_text,
-            cleaned_text=cleaned_text,
-            themes=themes,
-            classification=classification,
-            document_id=missing_file
-        )
-
-        logger.info(f"Dashboard: Successfully stored baseline analysis with ID {analysis_id}")
-        new_analysis = db_operations.get_analysis_by_id(analysis_id)
-        if new_analysis:
-            new_analysis['is_baseline'] = True
-            new_analysis['is_user_analysis'] = False
-            analyses_by_filename[missing_file] = new_analysis
-            logger.info(f"Dashboard: Added proper baseline analysis for {missing_file} with ID {analysis_id}")
-            return
-        else:
-            logger.error(f"Dashboard: Failed to retrieve newly created analysis for {missing_file}")
-            raise RuntimeError("retrieve_failed")
-
-    except (ValueError, KeyError, RuntimeError, OSError) as store_error:
-        logger.error(f"Dashboard: Error storing baseline analysis: {store_error}")
-        placeholder_analysis = _build_placeholder_analysis(
-            missing_file,
-            baseline_filename,
-            university_name,
-            classification,
-            themes,
-            extracted_text,
-            cleaned_text,
-            store_error
-        )
-        analyses_by_filename[missing_file] = placeholder_analysis
-        logger.info(f"Dashboard: Added placeholder analysis for {missing_file} due to storage error")
-def _create_missing_baselines(clean_dataset_dir, missing_files, analyses_by_filename):
-    """Create baseline analyses for missing files using safe helpers."""
-    for missing_file in missing_files:
-        # Skip auxiliary/helper files
-        if 'guidance' in missing_file.lower() or missing_file == 'dataset_info.md':
-            continue
-
-        file_path = os.path.join(clean_dataset_dir, missing_file)
-        if not os.path.exists(file_path):
-            logger.error(f"Dashboard: Missing file not found: {file_path}")
-            continue
-
-        university_name = missing_file.split('-')[0].replace('university', '').strip().title()
-        if not university_name:
-            university_name = missing_file.split('.')[0].replace('university', '').strip().title()
-
-        baseline_filename = f"{BASELINE_PREFIX} {university_name}"
-        logger.info(f"Dashboard: Creating baseline analysis for {missing_file} as '{baseline_filename}'")
-
-        try:
-            extracted_text = _extract_text_with_fallback(file_path, university_name)
-            cleaned_text = _clean_text_safe(extracted_text, missing_file)
-            themes = _extract_themes_safe(cleaned_text, missing_file)
-            classification = _classify_policy_safe(cleaned_text, missing_file)
-
-            _store_baseline_or_placeholder(
-                analyses_by_filename,
-                missing_file,
-                baseline_filename,
-                extracted_text,
-                cleaned_text,
-                themes,
-                classification,
-                university_name
-            )
-        except Exception as e:
-            logger.error(f"Dashboard: Error creating baseline analysis for {missing_file}: {str(e)}")
-            if missing_file not in analyses_by_filename:
-                placeholder_analysis = {
-                    '_id': f"placeholder_{missing_file.replace('.', '_')}",
-                    'filename': baseline_filename or f"{BASELINE_PREFIX} {missing_file}",
-                    'document_id': missing_file,
-                    'title': f"Policy from {university_name or missing_file.split('-')[0].title()}",
-                    'analysis_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    'user_id': -1,
-                    'is_user_analysis': False,
-                    'is_baseline': True,
-                    'is_placeholder': True,
-                    'classification': {
-                        "classification": "Moderate",
-                        "confidence": 75,
-                        "source": "Placeholder"
-                    },
-                    'score': 50,
-                    'themes': [{"name": "Policy", "score": 0.8, "confidence": 75}],
-                    'summary': f"This is a placeholder for {missing_file}. The original file could not be processed.",
-                    'text_data': {
-                        'original_text': f"Placeholder for {missing_file}",
-                        'cleaned_text': f"Placeholder for {missing_file}",
-                        'text_length': 0
-                    }
-                }
-                analyses_by_filename[missing_file] = placeholder_analysis
-                logger.info(f"Dashboard: Added placeholder analysis for {missing_file} due to general error")
 def _normalize_classification_field(processed_analysis: dict) -> None:
     """Ensure classification is present, standardized, and valid; logs unexpected types."""
     if 'classification' not in processed_analysis:
@@ -1449,106 +1569,87 @@ def _ensure_required_defaults(processed_analysis: dict) -> None:
 def _format_analysis_date_inplace(processed_analysis: dict) -> None:
     """Format analysis_date to '%Y-%m-%d %H:%M:%S' string while being tolerant of types."""
     if 'analysis_date' not in processed_analysis:
-        processed_analysis['analysis_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        processed_analysis['analysis_date'] = current_timestamp()
         return
 
     date_val = processed_analysis['analysis_date']
+    if isinstance(date_val, datetime):
+        processed_analysis['analysis_date'] = _format_display_datetime(date_val)
+        return
     if hasattr(date_val, 'strftime'):
-        processed_analysis['analysis_date'] = date_val.strftime('%Y-%m-%d %H:%M:%S')
+        processed_analysis['analysis_date'] = date_val.strftime(DATETIME_FORMAT)
         return
     if isinstance(date_val, str):
         try:
             dt = datetime.fromisoformat(date_val.replace('Z', TIMEZONE_SUFFIX))
-            processed_analysis['analysis_date'] = dt.strftime('%Y-%m-%d %H:%M:%S')
+            processed_analysis['analysis_date'] = _format_display_datetime(dt)
         except Exception:
             # Keep original string if parsing fails
             pass
 
 
+def _format_display_datetime(dt: datetime) -> str:
+    """Render as '%Y-%m-%d %H:%M:%S' (wall time); isoformat is about twice as fast as strftime."""
+    return dt.replace(tzinfo=None).isoformat(' ', 'seconds')
+
+
 def _process_analyses_for_display(analyses):
-    """Process analyses for display by converting dates and preparing data."""
+    """Process analyses for display by converting dates and preparing data.
+
+    Rows are updated in place: the dashboard bundle is fetched per request and its
+    documents are not used again once charts have been built, so copying them first
+    only doubled the allocations.
+    """
     processed = []
     for analysis in analyses:
         if not isinstance(analysis, dict):
             logger.error(f"Dashboard error: Skipping non-dict analysis: {type(analysis)}")
             continue
 
-        processed_analysis = analysis.copy()
-        _normalize_classification_field(processed_analysis)
-        _ensure_required_defaults(processed_analysis)
-        _format_analysis_date_inplace(processed_analysis)
-        processed.append(processed_analysis)
+        _normalize_classification_field(analysis)
+        _ensure_required_defaults(analysis)
+        _format_analysis_date_inplace(analysis)
+        processed.append(analysis)
     return processed
 
+# Map of legacy categories to standard categories
+CLASSIFICATION_CATEGORY_MAP = {
+    # Standard categories (keep as is)
+    'Restrictive': 'Restrictive',
+    'Moderate': 'Moderate',
+    'Permissive': 'Permissive',
+
+    # Legacy categories (map to standard)
+    'Educational': 'Moderate',
+    'Research-focused': 'Permissive',
+    'Comprehensive': 'Moderate',
+    'Balanced': 'Moderate',  # Just in case
+
+    # Default for unknown
+    'Unknown': 'Moderate'
+}
+
 def _standardize_classification(classification):
     """
     Standardize classification to use only Restrictive, Moderate, or Permissive.
     Maps legacy categories to standard ones.
     """
-    # Map of legacy categories to standard categories
-    category_map = {
-        # Standard categories (keep as is)
-        'Restrictive': 'Restrictive',
-        'Moderate': 'Moderate',
-        'Permissive': 'Permissive',
-        
-        # Legacy categories (map to standard)
-        'Educational': 'Moderate',
-        'Research-focused': 'Permissive',
-        'Comprehensive': 'Moderate',
-        'Balanced': 'Moderate',  # Just in case
-        
-        # Default for unknown
-        'Unknown': 'Moderate'
-    }
-    
     # Return standardized classification or default to Moderate if not in map
-    return category_map.get(classification, 'Moderate')
-
-def _increment_classification_counts(classification_counts: dict, classification_value) -> None:
-    """Normalise and increment classification count. Logs unexpected types."""
-    if isinstance(classification_value, dict):
-        cls = classification_value.get('classification', 'Moderate')
-    elif isinstance(classification_value, str):
-        cls = classification_value
-    else:
-        cls = 'Moderate'
-        logger.error(f"Analytics error: Unexpected classification type: {type(classification_value)}")
-    standardized_cls = _standardize_classification(cls)
-    classification_counts[standardized_cls] = classification_counts.get(standardized_cls, 0) + 1
-
-
-def _accumulate_theme_frequencies(theme_frequencies: dict, themes_value) -> None:
-    """Accumulate per-theme frequencies from a possibly invalid themes payload."""
-    themes_list = themes_value if isinstance(themes_value, list) else []
-    for theme in themes_list:
-        if isinstance(theme, dict):
-            theme_name = theme.get('name', 'Unknown')
-        else:
-            theme_name = str(theme)
-        theme_frequencies[theme_name] = theme_frequencies.get(theme_name, 0) + 1
-
+    return CLASSIFICATION_CATEGORY_MAP.get(classification, 'Moderate')
 
 def _ensure_all_standard_classes(counts: dict) -> None:
     for cls in ['Restrictive', 'Moderate', 'Permissive']:
         counts.setdefault(cls, 0)
 
 
-def _calculate_analytics(analyses):
-    """Calculate analytics (classifications and themes) from analyses."""
-    classification_counts = {}
-    theme_frequencies = {}
+def _standardize_classification_counts(raw_counts: dict) -> dict:
+    """Fold raw per-label counts from the DB into the three standard classes."""
+    counts = Counter()
+    for cls, count in raw_counts.items():
+        counts[_standardize_classification(cls if isinstance(cls, str) else 'Moderate')] += count
+    _ensure_all_standard_classes(counts)
+    return dict(counts)
 
-    for analysis in analyses:
-        if not isinstance(analysis, dict):
-            logger.error(f"Analytics error: Skipping non-dict analysis: {type(analysis)}")
-            continue
-
-        _increment_classification_counts(classification_counts, analysis.get('classification', 'Moderate'))
-        _accumulate_theme_frequencies(theme_frequencies, analysis.get('themes', []))
-
-    _ensure_all_standard_classes(classification_counts)
-    return classification_counts, theme_frequencies
 
 def _get_minimal_dashboard_data(user):
     """Return minimal dashboard data for error cases."""
@@ -1578,12 +1679,14 @@ def dashboard():
     try:
         logger.info(f"Dashboard accessed by user: {current_user.username}")
 
-        user_analyses, baseline_analyses = _get_user_and_baseline_analyses(current_user.id)
-        combined_analyses = _prepare_combined_analyses(user_analyses, baseline_analyses)
+        bundle = _get_dashboard_bundle(current_user.id)
+        user_analyses = bundle['user_analyses']
+        if _schedule_missing_baselines(bundle['analyses']):
+            flash('Baseline policies are being prepared in the background. Refresh shortly to see them.', 'info')
 
         _load_sample_policies_if_needed(user_analyses)
 
-        dashboard_data = _prepare_dashboard_data(current_user, user_analyses, combined_analyses)
+        dashboard_data = _prepare_dashboard_data(current_user, user_analyses, bundle['analyses'], bundle)
         return render_template('dashboard.html', data=dashboard_data)
 
     except Exception as e:
@@ -1593,106 +1696,175 @@ def dashboard():
 
 def _get_clean_dataset_dir():
     """Return absolute path to clean_dataset directory."""
-    from pathlib import Path
-    return Path(__file__).resolve().parent / 'data' / 'policies' / 'clean_dataset'
+    return CLEAN_DATASET_DIR
+
+# clean_dataset listings keyed by directory -> (st_mtime_ns, tuple of filenames)
+_clean_dataset_listing_cache = {}
 
 def _list_clean_dataset_files(clean_dataset_dir):
-    """List valid policy files from clean_dataset directory."""
+    """List valid policy files from clean_dataset directory.
+
+    The listing is cached against the directory's mtime, so a dashboard hit costs a
+    single stat unless files were added, removed or renamed since the last scan.
+    """
+    try:
+        mtime_ns = os.stat(clean_dataset_dir).st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    cache_key = str(clean_dataset_dir)
+    cached = _clean_dataset_listing_cache.get(cache_key)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
     logger.info(f"Dashboard: Using clean_dataset directory: {clean_dataset_dir}")
     files = []
-    if os.path.exists(clean_dataset_dir):
-        for filename in os.listdir(clean_dataset_dir):
-            if filename.endswith(('.pdf', DOCX_EXTENSION)) and 'guidance' not in filename.lower():
-                files.append(filename)
+    try:
+        with os.scandir(clean_dataset_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if filename.endswith(('.pdf', DOCX_EXTENSION)) and 'guidance' not in filename.lower() \
+                        and entry.is_file():
+                    files.append(filename)
+    except FileNotFoundError:
+        return ()
+    files = tuple(files)
+    _clean_dataset_listing_cache[cache_key] = (mtime_ns, files)
     logger.info(f"Dashboard: Found {len(files)} policy files in clean_dataset")
     return files
 
-def _get_user_and_baseline_analyses(user_id: int):
-    """Fetch and log user and baseline analyses after deduplication."""
-    db_operations.deduplicate_baseline_analyses(user_id)
-    user_analyses = db_operations.get_user_analyses(user_id)
-    baseline_analyses = db_operations.get_user_analyses(-1)
-    logger.info(f"Dashboard: Found {len(user_analyses)} user analyses and {len(baseline_analyses)} baseline analyses")
-    return user_analyses, baseline_analyses
+def _get_dashboard_bundle(user_id: int):
+    """Fetch merged user/baseline analyses plus aggregates in one DB round-trip.
 
-def _prepare_combined_analyses(user_analyses, baseline_analyses):
-    """Prepare merged, baseline-complete, sorted analyses list with logs preserved."""
+    The user's own analyses are collected into bundle['user_analyses'] in the same pass
+    that flags them.
+    """
+    bundle = db_operations.get_dashboard_bundle(user_id)
+    user_analyses = []
+    for analysis in bundle['analyses']:
+        is_user_analysis = analysis['is_user_analysis'] = analysis.get('user_id') == user_id
+        if is_user_analysis:
+            user_analyses.append(analysis)
+    bundle['user_analyses'] = user_analyses
+    logger.info(f"Dashboard: Found {len(bundle['analyses'])} merged user/baseline analyses")
+    return bundle
+
+def _schedule_missing_baselines(merged_analyses):
+    """Queue baseline analysis for clean_dataset files not yet in the merged analyses.
+
+    Files already being built, or attempted within BASELINE_BACKFILL_RETRY_SECONDS,
+    are skipped. Returns the number of files newly queued by this call.
+    """
     clean_dataset_dir = _get_clean_dataset_dir()
     clean_dataset_files = _list_clean_dataset_files(clean_dataset_dir)
 
-    analyses_by_filename = _merge_user_and_baseline_analyses(user_analyses, baseline_analyses)
+    analyses_by_filename = {a['filename']: a for a in merged_analyses}
     missing_files = _identify_missing_clean_files(clean_dataset_files, analyses_by_filename)
     logger.info(f"Dashboard: Missing files from clean_dataset: {missing_files}")
-    _create_missing_baselines(clean_dataset_dir, missing_files, analyses_by_filename)
-
-    combined_analyses = list(analyses_by_filename.values())
-    logger.info(f"Dashboard: Combined into {len(combined_analyses)} total analyses")
-    displayed_files = [analysis.get('filename', '') for analysis in combined_analyses]
-    logger.info(f"Dashboard: Displaying analyses for: {sorted(displayed_files)}")
-    combined_analyses.sort(key=lambda a: _to_epoch(a.get('analysis_date')), reverse=True)
-    return combined_analyses
-
-def _merge_user_and_baseline_analyses(user_analyses, baseline_analyses):
-    """Merge analyses preferring user analyses over baseline ones."""
-    analyses_by_filename = {}
-    for analysis in user_analyses:
-        filename = analysis.get('filename', '')
-        if not filename:
-            continue
-        analyses_by_filename[filename] = analysis
-        analysis['is_user_analysis'] = True
-    for analysis in baseline_analyses:
-        filename = analysis.get('filename', '')
-        if not filename or filename in analyses_by_filename:
-            continue
-        analyses_by_filename[filename] = analysis
-        analysis['is_user_analysis'] = False
-    return analyses_by_filename
+    if not missing_files:
+        return 0
+
+    now = time.monotonic()
+    with _baseline_backfill_lock:
+        queued = [f for f in missing_files
+                  if f not in _baseline_backfill_pending and _baseline_backfill_retry_after.get(f, 0) <= now]
+        _baseline_backfill_pending.update(queued)
+    if queued:
+        _baseline_pool.submit(_backfill_baselines, clean_dataset_dir, queued)
+    logger.info(f"Dashboard: Queued {len(queued)} baseline(s) for background analysis")
+    return len(queued)
+
+def _backfill_baselines(clean_dataset_dir, missing_files):
+    """Analyse and store missing baselines; runs on the baseline worker thread."""
+    try:
+        extracted_texts = _extract_baseline_texts(clean_dataset_dir, missing_files)
+    except Exception as e:
+        logger.warning(f"Dashboard: Parallel baseline extraction failed, extracting inline: {e}")
+        extracted_texts = {}
+    entries = []
+    for missing_file in missing_files:
+        try:
+            entry = _analyse_baseline_file(clean_dataset_dir, missing_file, extracted_texts.get(missing_file))
+            if entry:
+                entries.append(entry)
+        except Exception as e:
+            logger.error(f"Dashboard: Background baseline creation failed for {missing_file}: {e}")
+    try:
+        # One unordered bulk upsert for the whole batch; re-running it is harmless
+        stored = db_operations.store_analysis_results_bulk(entries)
+        logger.info(f"Dashboard: Stored {stored} baseline analyses")
+    except Exception as e:
+        logger.error(f"Dashboard: Error storing baseline analyses: {e}")
+    finally:
+        retry_after = time.monotonic() + BASELINE_BACKFILL_RETRY_SECONDS
+        with _baseline_backfill_lock:
+            _baseline_backfill_pending.difference_update(missing_files)
+            _baseline_backfill_retry_after.update(dict.fromkeys(missing_files, retry_after))
+
+def _extract_baseline_texts(clean_dataset_dir, missing_files):
+    """Extract text for several baseline files in parallel; returns {filename: text}.
+
+    Files the pool could not extract are left out and extracted inline by _analyse_baseline_file.
+    """
+    files = [f for f in missing_files
+             if not _is_auxiliary_dataset_file(f) and os.path.exists(os.path.join(clean_dataset_dir, f))]
+    paths = [os.path.join(clean_dataset_dir, f) for f in files]
+    names = [_baseline_university_name(f) for f in files]
+    texts = _extract_texts_parallel(_extraction_pool, paths, names)
+    return {f: text for f, text in zip(files, texts) if text} if texts else {}
+
+def _extract_texts_parallel(pool, paths, names, placeholder_on_timeout=False):
+    """Extract several files in the given ExtractionPool.
+
+    Returns the texts in input order with None for files the pool could not extract, or
+    None when there are too few files to be worth shipping to workers.
+    """
+    if len(paths) < 2:
+        return None
+    return pool.extract_many(paths, names, placeholder_on_timeout=placeholder_on_timeout)
 
 def _identify_missing_clean_files(clean_dataset_files, analyses_by_filename):
-    """Return clean_dataset files that are not represented in analyses."""
-    missing_files = []
-    for clean_file in clean_dataset_files:
-        found = False
-        for filename in analyses_by_filename.keys():
-            analysis = analyses_by_filename[filename]
-            if clean_file == filename or (analysis.get('document_id') and clean_file == analysis.get('document_id')):
-                found = True
-                logger.info(f"Dashboard: Found match for {clean_file} in analysis {filename}")
-                break
-        if not found:
-            missing_files.append(clean_file)
-    return missing_files
+    """Return clean_dataset files that are not represented in analyses.
+
+    A file counts as represented when it matches an analysis filename or document_id.
+    """
+    known = set(analyses_by_filename)
+    known.update(a['document_id'] for a in analyses_by_filename.values() if a.get('document_id'))
+    return [clean_file for clean_file in clean_dataset_files if clean_file not in known]
 
 def _load_sample_policies_if_needed(user_analyses):
-    """Load sample policies if user has none."""
-    if not any(a.get('filename','').startswith(BASELINE_PREFIX) for a in user_analyses):
-        try:
-            loaded = db_operations.load_sample_policies_for_user(current_user.id)
-            if loaded:
-                flash('Sample baseline policies have been loaded to your dashboard.', 'success')
-        except Exception as e:
-            logger.error(f"Failed to auto-load baseline policies: {e}")
+    """Load sample policies if user has none.
 
-def _prepare_dashboard_data(user, user_analyses, combined_analyses):
-    """Prepare the complete dashboard data structure."""
+    Once the user's baseline copies are known to exist this is remembered in the
+    session, so later dashboard loads skip the scan.
+    """
+    if session.get(SESSION_BASELINES_LOADED) == current_user.id:
+        return
+    if any(a.get('filename','').startswith(BASELINE_PREFIX) for a in user_analyses):
+        session[SESSION_BASELINES_LOADED] = current_user.id
+        return
+    try:
+        loaded = db_operations.load_sample_policies_for_user(current_user.id)
+        if loaded:
+            session[SESSION_BASELINES_LOADED] = current_user.id
+            flash('Sample baseline policies have been loaded to your dashboard.', 'success')
+    except Exception as e:
+        logger.error(f"Failed to auto-load baseline policies: {e}")
+
+def _prepare_dashboard_data(user, user_analyses, combined_analyses, bundle):
+    """Prepare the complete dashboard data structure; aggregates come from the DB bundle."""
     # Generate charts
     dashboard_charts = _safe_generate_dashboard_charts(user_analyses)
 
-    # Log analyses before analytics calculation
-    for i, analysis in enumerate(combined_analyses):
-        logger.info(f"Dashboard debug: Analysis {i} type: {type(analysis)}")
-        if isinstance(analysis, dict):
-            cls = analysis.get('classification', 'Not found')
-            logger.info(f"Dashboard debug: Analysis {i} classification type: {type(cls)}, value: {cls}")
-        else:
-            logger.error(f"Dashboard debug: Analysis {i} is not a dict: {type(analysis)}")
+    # Per-row tracing formats every classification, so only walk the rows when enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, analysis in enumerate(combined_analyses):
+            cls = analysis.get('classification', 'Not found') if isinstance(analysis, dict) else None
+            logger.debug("Dashboard debug: Analysis %d type: %s, classification: %r", i, type(analysis), cls)
 
     # Calculate analytics
-    classification_counts, theme_frequencies = _safe_calculate_analytics(combined_analyses)
-
-    # Get combined statistics
-    db_stats = _safe_get_combined_stats(user.id)
+    classification_counts = _standardize_classification_counts(bundle['classification_counts'])
+    theme_frequencies = bundle['theme_frequencies']
+    db_stats = _format_statistics(bundle['statistics'])
 
     # Prepare user data
     user_data = {
@@ -1718,7 +1890,7 @@ def _prepare_dashboard_data(user, user_analyses, combined_analyses):
     }
 
     # Log dashboard data structure
-    logger.info(f"Dashboard debug: Dashboard data keys: {list(dashboard_data.keys())}")
+    logger.debug("Dashboard debug: Dashboard data keys: %s", list(dashboard_data.keys()))
     
     return dashboard_data
 
@@ -1730,40 +1902,24 @@ def _safe_generate_dashboard_charts(user_analyses):
         logger.error(f"Chart generation error: {e}")
         return {}
 
-def _safe_calculate_analytics(combined_analyses):
-    """Calculate analytics with fallbacks; log concise error."""
-    try:
-        classification_counts, theme_frequencies = _calculate_analytics(combined_analyses)
-        logger.info(f"Dashboard debug: Classification counts: {classification_counts}")
-        return classification_counts, theme_frequencies
-    except Exception as e:
-        logger.error(f"Analytics calculation error: {e}")
-        return {'Restrictive': 0, 'Moderate': 0, 'Permissive': 0}, {}
-
-def _safe_get_combined_stats(user_id: int):
-    """Fetch and combine DB stats with rounding; on error return zeros."""
-    try:
-        user_stats = db_operations.get_analysis_statistics(user_id)
-        baseline_stats = db_operations.get_analysis_statistics(-1)
-        combined_stats = _combine_stats(user_stats, baseline_stats)
-        return {
-            'total_analyses': combined_stats.get('total', 0),
-            'avg_confidence': round(combined_stats.get('avg_confidence', 0), 1),
-            'avg_themes_per_analysis': round(combined_stats.get('avg_themes_per_analysis', 0), 1)
-        }
-    except Exception as e:
-        logger.error(f"DB stats error: {e}")
-        return {'total_analyses': 0, 'avg_confidence': 0, 'avg_themes_per_analysis': 0}
+def _format_statistics(stats):
+    """Map DB statistics onto the keys used by the dashboard template."""
+    return {
+        'total_analyses': stats.get('total', 0),
+        'avg_confidence': round(stats.get('avg_confidence', 0) or 0, 1),
+        'avg_themes_per_analysis': round(stats.get('avg_themes_per_analysis', 0) or 0, 1)
+    }
 
 def _safe_process_analyses_for_display(combined_analyses):
     """Process analyses for display with error handling and debug logs."""
     try:
         processed = _process_analyses_for_display(combined_analyses)
         logger.info(f"Dashboard: Processed {len(processed)} analyses for display")
-        for i, analysis in enumerate(processed[:3]):
-            logger.info(f"Dashboard debug: Processed analysis {i} keys: {list(analysis.keys())}")
-            if 'classification' in analysis:
-                logger.info(f"Dashboard debug: Processed analysis {i} classification type: {type(analysis['classification'])}, value: {analysis['classification']}")
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, analysis in enumerate(processed[:3]):
+                logger.debug(f"Dashboard debug: Processed analysis {i} keys: {list(analysis.keys())}")
+                if 'classification' in analysis:
+                    logger.debug(f"Dashboard debug: Processed analysis {i} classification type: {type(analysis['classification'])}, value: {analysis['classification']}")
         return processed
     except Exception as e:
         logger.error(f"Processing analyses error: {e}")
@@ -1838,13 +1994,17 @@ def batch_analyse(files):
 
         logger.info(f"Starting batch analysis of {len(file_list)} files")
 
-        batch_results, successful_analyses, failed_analyses = _process_batch_files(file_list)
+        batch_results, successful_analyses, failed_analyses, tally = _process_batch_files(file_list)
 
-        batch_summary = _summarize_batch_results(file_list, successful_analyses, failed_analyses)
+        batch_summary = _summarize_batch_results(file_list, successful_analyses, failed_analyses, tally)
 
-        return render_template('batch_analysis.html',
-                               results=batch_results,
-                               summary=batch_summary)
+        payload = {
+            'results': batch_results,
+            'summary': batch_summary,
+            'user': current_user,
+            'analysis_date': current_timestamp()
+        }
+        return render_template('batch_results.html', data=payload)
         
     except Exception as e:
         logger.error(f"Error in batch analysis: {str(e)}")
@@ -1863,35 +2023,13 @@ def _resolve_file_path_for_analysis(filename: str, is_baseline: bool):
     if is_baseline:
         # Map display name back to actual filename
         original_filename = filename.split(' - ')[-1] if ' - ' in filename else filename.replace(BASELINE_PREFIX + ' ', '')
-        university_file_mapping = {
-            'University of Oxford': 'oxford-ai-policy.pdf',
-            'University of Cambridge': 'cambridge-ai-policy.pdf',
-            'Imperial College London': 'imperial-ai-policy.docx',
-            'University of Edinburgh': 'edinburgh university-ai-policy.pdf',
-            'Leeds Trinity University': 'leeds trinity university-ai-policy.pdf',
-            'MIT': 'mit-ai-policy.pdf',
-            'Harvard University': 'harvard-ai-policy.pdf',
-            'Stanford University': 'stanford-ai-policy.pdf',
-            'University of Tokyo': 'tokyo-ai-policy.docx',
-            'Jagiellonian University': 'jagiellonian university-ai-policy.pdf',
-            'Belfast University': 'belfast university-ai-policy.pdf',
-            'University of Chicago': 'chicago-ai-policy.docx',
-            'Columbia University': 'columbia-ai-policy.pdf',
-            'Cornell University': 'cornell-ai-policy.docx',
-            'University of Liverpool': 'liverpool policy-ai-policy.pdf'
-        }
-        actual_filename = university_file_mapping.get(original_filename, original_filename)
-        clean_dataset_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'policies', 'clean_dataset')
-        file_path = os.path.join(clean_dataset_dir, actual_filename)
-        logger.info(f"Baseline analysis - Display name: {original_filename}")
-        logger.info(f"Baseline analysis - Mapped filename: {actual_filename}")
-        logger.info(f"Baseline analysis - File path: {file_path}")
-        logger.info(f"Baseline analysis - File exists: {os.path.exists(file_path)}")
+        actual_filename = BASELINE_FILE_MAPPING.get(original_filename, original_filename)
+        file_path = os.path.join(CLEAN_DATASET_DIR, actual_filename)
+        logger.info(f"Baseline analysis - Display name: {original_filename}, file path: {file_path}")
         return file_path, original_filename, actual_filename
     else:
         file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
         logger.info(f"User analysis - File path: {file_path}")
-        logger.info(f"User analysis - File exists: {os.path.exists(file_path)}")
         return file_path, None, None
 
 def _get_existing_analysis_record(filename: str, is_baseline: bool):
@@ -1920,9 +2058,10 @@ def _extract_and_analyse_text(file_path: str):
     classification = policy_classifier.classify_policy(cleaned_text)
     return extracted_text, cleaned_text, themes, classification
 
-def _store_analysis_results(filename, extracted_text, cleaned_text, themes, classification):
-    """Store analysis results in DB and return analysis_id."""
-    return db_operations.store_user_analysis_results(
+def _submit_analysis_store(filename, extracted_text, cleaned_text, themes, classification):
+    """Queue storing the analysis results on the I/O pool; the future resolves to the analysis_id."""
+    return _io_pool.submit(
+        db_operations.store_user_analysis_results,
         user_id=current_user.id,
         filename=filename,
         original_text=extracted_text,
@@ -1935,10 +2074,15 @@ def _store_analysis_results(filename, extracted_text, cleaned_text, themes, clas
 def _generate_analysis_derivatives(cleaned_text, themes, classification):
     """Generate charts and summaries used by results view."""
     charts = chart_generator.generate_analysis_charts(themes, classification, cleaned_text)
+    text_stats, theme_summary, classification_details = _generate_text_derivatives(cleaned_text, themes)
+    return charts, text_stats, theme_summary, classification_details
+
+def _generate_text_derivatives(cleaned_text, themes):
+    """Generate the text statistics and summaries (everything except charts) for results view."""
     text_stats = text_processor.get_text_statistics(cleaned_text)
     theme_summary = theme_extractor.get_theme_summary(themes)
     classification_details = policy_classifier.get_classification_details(cleaned_text)
-    return charts, text_stats, theme_summary, classification_details
+    return text_stats, theme_summary, classification_details
 
 def _build_results_payload(filename, analysis_id, themes, classification, charts,
                            text_stats, theme_summary, classification_details,
@@ -1966,7 +2110,7 @@ def _build_results_payload(filename, analysis_id, themes, classification, charts
         'text_stats': text_stats,
         'theme_summary': theme_summary,
         'classification_details': classification_details,
-        'analysis_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'analysis_date': current_timestamp(),
         'user': current_user,
         'processing_summary': {
             'original_length': len(extracted_text) if extracted_text else 0,
@@ -1993,17 +2137,29 @@ def analyse_document(filename):
         if early is not None:
             return early
 
-        file_path, early = _resolve_and_validate_path_or_redirect(filename, is_baseline)
+        file_path, file_stat, early = _resolve_and_validate_path_or_redirect(filename, is_baseline)
         if early is not None:
             return early
 
+        # Repeat views of an unchanged file and stored analysis revalidate without NLP or
+        # rendering; a page from a brand-new analysis gets its ETag on the next view
+        existing = _get_existing_analysis_record(filename, is_baseline)
+        etag = _analysis_etag(filename, file_stat, existing) if existing else None
+        if etag and etag in request.if_none_match and not session.get('_flashes'):
+            logger.info(f"Analysis not modified, returning 304: {filename}")
+            not_modified = make_response('', 304)
+            not_modified.set_etag(etag)
+            return not_modified
+
         logger.info(f"Starting analysis of file: {filename}")
 
-        extracted_text, cleaned_text, themes, classification, analysis_id = _get_or_create_analysis_record(
-            filename, is_baseline, file_path
+        extracted_text, cleaned_text, themes, classification, stored = _get_or_create_analysis_record(
+            filename, file_path, existing
         )
 
+        # Charts and summaries are built while a new analysis is still being written
         charts, text_stats, theme_summary, classification_details = _generate_analysis_derivatives(cleaned_text, themes, classification)
+        analysis_id = stored.result()
 
         logger.info(f"Analysis completed successfully for: {filename}")
 
@@ -2011,12 +2167,25 @@ def analyse_document(filename):
                                          text_stats, theme_summary, classification_details,
                                          extracted_text, cleaned_text)
 
-        return render_template('results.html', results=results)
+        # Pages carrying one-off flash messages must not be revalidated later
+        cacheable = etag is not None and not session.get('_flashes')
+        response = make_response(render_template('results.html', results=results))
+        if cacheable:
+            response.set_etag(etag)
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+        return response
 
     except Exception as e:
         logger.error(f"Error during analysis of {filename}: {str(e)}")
         return _flash_and_redirect('upload_file', 'Error analysing document. Please try again.', 'error')
 
+def _analysis_etag(filename: str, st: os.stat_result, analysis) -> str:
+    """ETag for a rendered analysis page: deploy version, user, file identity and stored analysis."""
+    key = (f"{app.config.get('ETAG_VERSION', '')}:{current_user.id}:{filename}:{st.st_mtime_ns}:{st.st_size}:"
+           f"{analysis.get('_id')}:{analysis.get('analysis_date')}")
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
 def _authorize_analysis_or_redirect(filename: str, is_baseline: bool):
     """Authorise analysis request or return a redirect Response if not allowed."""
     if not _is_authorised_for_filename(filename, is_baseline):
@@ -2024,12 +2193,17 @@ def _authorize_analysis_or_redirect(filename: str, is_baseline: bool):
     return None
 
 def _resolve_and_validate_path_or_redirect(filename: str, is_baseline: bool):
-    """Resolve path for analysis and ensure it exists; return (path, redirect_or_none)."""
+    """Resolve path for analysis and ensure it exists; return (path, stat_result, redirect_or_none).
+
+    The stat result is reused for the page ETag, so the file is stat-ed once per request.
+    """
     file_path, _, _ = _resolve_file_path_for_analysis(filename, is_baseline)
-    if not os.path.exists(file_path):
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
-        return None, _flash_and_redirect('upload_file', 'File not found', 'error')
-    return file_path, None
+        return None, None, _flash_and_redirect('upload_file', 'File not found', 'error')
+    return file_path, st, None
 
 @app.route('/validate/<analysis_id>')
 @login_required
@@ -2040,28 +2214,27 @@ def validate_analysis(analysis_id):
     Validates the academic sources and citations used in recommendations
     to ensure proper referencing standards.
     """
-    from flask import jsonify
-    analysis = db_operations.get_analysis_by_id(analysis_id)
+    analysis = _get_analysis_cached(analysis_id)
     if not analysis:
         return jsonify({"error": ANALYSIS_NOT_FOUND}), 404
     recs = db_operations.get_recommendations_by_analysis(current_user.id, analysis_id)
     if not recs:
         # fallback: any user_id
-        any_doc = db_operations.recommendations.find_one({"analysis_id": analysis_id})
+        any_doc = db_operations.recommendations.find_one(
+            {"analysis_id": analysis_id}, {"_id": 0, "recommendations": 1})
         if any_doc:
             recs = any_doc.get("recommendations", [])
         else:
             # As a last resort, generate recommendations on the fly for validation
             text_data = analysis.get('text_data', {})
             cleaned_text = text_data.get('cleaned_text', text_data.get('original_text', ''))
-            rec_package = recommendation_engine.generate_recommendations(
-                themes=analysis.get('themes', []),
-                classification=analysis.get('classification', {}),
-                text=cleaned_text,
-                analysis_id=analysis_id,
+            rec_package = _generate_recommendations_cached(
+                analysis.get('themes', []),
+                analysis.get('classification', {}),
+                cleaned_text,
+                analysis_id,
             )
             recs = rec_package.get('recommendations', [])
-    from src.utils.validation import validate_recommendation_sources
     issues = validate_recommendation_sources(recs)
     return jsonify({"issues": issues})
 
@@ -2098,9 +2271,9 @@ def get_recommendations(analysis_id):
     AI framework analysis and institutional context assessment.
     """
     try:
-        logger.info("=== Starting recommendation generation ===")
-        logger.info(f"User ID: {current_user.id}, Username: {getattr(current_user, 'username', 'N/A')}")
-        logger.info(f"Analysis ID: {analysis_id}")
+        logger.debug("=== Starting recommendation generation ===")
+        logger.debug("User ID: %s, Username: %s", current_user.id, getattr(current_user, 'username', 'N/A'))
+        logger.debug("Analysis ID: %s", analysis_id)
 
         prep, error = _prepare_recommendation_inputs(analysis_id)
         if error:
@@ -2118,10 +2291,11 @@ def get_recommendations(analysis_id):
             return redirect(url_for('dashboard'))
 
         recommendation_data = _build_recommendation_data(analysis_id, analysis, themes, classification, recommendation_package)
-        logger.info(f"Generated {recommendation_data['total_recommendations']} recommendations")
+        logger.info("Generated %s recommendations for analysis %s",
+                    recommendation_data['total_recommendations'], analysis_id)
         try:
             has_narr = bool(recommendation_data.get('narrative', {}).get('html'))
-            logger.info(f"Narrative present: {has_narr}")
+            logger.debug("Narrative present: %s", has_narr)
         except Exception as _e:
             logger.warning(f"Could not determine narrative presence: {_e}")
 
@@ -2131,12 +2305,16 @@ def get_recommendations(analysis_id):
 
     except Exception as e:
         logger.error(f"Error generating recommendations: {str(e)}")
-        return _fallback_recommendations_response(analysis_id, locals().get('analysis'))
+        # Reuse whatever this request already fetched; never query again from the error path
+        cached = g.get('_analysis_cache', {})
+        analysis = locals().get('analysis') or next(
+            (doc for (aid, _, _), doc in cached.items() if aid == analysis_id and doc), None)
+        return _fallback_recommendations_response(analysis_id, analysis)
 
 
 def _get_analysis_for_deletion(user_id: int, analysis_id: str):
     """Fetch the user's analysis to delete or return None."""
-    return db_operations.get_user_analysis_by_id(user_id, analysis_id)
+    return _get_analysis_cached(analysis_id, user_id=user_id)
 
 def _is_protected_baseline(filename: str) -> bool:
     """Check whether the file is a baseline policy protected from deletion."""
@@ -2162,17 +2340,37 @@ def _build_possible_filenames(filename: str, user_id: int, document_id: str) ->
             ordered.append(n)
     return ordered
 
-def _cleanup_analysis_files(upload_folder: str, possible_filenames: list) -> None:
+def _cleanup_analysis_files(upload_folder: str, possible_filenames: list, user_id=None) -> None:
     """Attempt to delete physical files linked to the analysis; do not raise exceptions."""
+    # Files recorded at upload time are resolved with one indexed query
+    try:
+        record = db_operations.pop_uploaded_file(user_id, possible_filenames) if user_id is not None else None
+    except Exception as e:
+        logger.warning(f"Could not look up uploaded file record: {e}")
+        record = None
+    if record:
+        try:
+            os.remove(record['path'])
+            logger.info("Successfully deleted file: %s", record['path'])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not delete file {record['path']}: {e}")
+        return
+
+    # Uploads from before file records existed: probe the upload folder
     for fname in possible_filenames:
         file_path = os.path.join(upload_folder, fname)
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-                logger.info(f"Successfully deleted file: {file_path}")
-                break  # stop after the first successful deletion
-            except Exception as e:
-                logger.warning(f"Could not delete file {file_path}: {e}")
+        # Remove directly rather than stat first; a missing candidate is the common case
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            logger.warning(f"Could not delete file {file_path}: {e}")
+            continue
+        logger.info("Successfully deleted file: %s", file_path)
+        break  # stop after the first successful deletion
 
 def _delete_analysis_record(user_id: int, analysis_id: str) -> bool:
     """Delete the user's analysis record; return True/False according to the DB outcome."""
@@ -2187,7 +2385,7 @@ def _cleanup_analysis_files_after_deletion(analysis: dict, upload_folder: str) -
             analysis.get('user_id', None),
             analysis.get('document_id', '')
         )
-        _cleanup_analysis_files(upload_folder, possible_filenames)
+        _cleanup_analysis_files(upload_folder, possible_filenames, analysis.get('user_id'))
     except Exception as e:
         logger.error(f"Error during file cleanup for analysis {analysis.get('_id', 'unknown')}: {str(e)}")
 
@@ -2215,6 +2413,10 @@ def delete_analysis(analysis_id):
         if _delete_analysis_record(current_user.id, analysis_id):
             # Clean up associated files
             _cleanup_analysis_files_after_deletion(analysis, app.config['UPLOAD_FOLDER'])
+            # Sample loading matches the prefix case-insensitively, so a deleted
+            # baseline-style copy makes the dashboard re-check on its next load
+            if analysis.get('filename', '').upper().startswith(BASELINE_PREFIX):
+                session.pop(SESSION_BASELINES_LOADED, None)
             flash('Analysis deleted successfully.', 'success')
         else:
             flash('Failed to delete analysis.', 'error')
@@ -2225,6 +2427,7 @@ def delete_analysis(analysis_id):
         flash('An error occurred while deleting the analysis.', 'error')
         return redirect(url_for('dashboard'))
 
+@app.route('/api/explain/<analysis_id>')
 @login_required
 def api_explain_analysis(analysis_id):
     """
@@ -2242,14 +2445,37 @@ def api_explain_analysis(analysis_id):
         if not cleaned_text:
             return jsonify({'error': 'No cleaned text available'}), 400
 
-        classifier = PolicyClassifier()
-        keywords = classifier.explain_classification(cleaned_text, top_n=15)
+        keywords = policy_classifier.explain_classification(cleaned_text, top_n=15)
         result = [{"term": kw, "category": cat, "score": score} for kw, cat, score in keywords]
         return jsonify({'analysis_id': analysis_id, 'keywords': result})
     except Exception as e:
         logger.error(f"API explain error for analysis {analysis_id}: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/upload', methods=['POST'])
+@login_required
+def api_upload_stream():
+    """
+    API endpoint that streams a raw request body straight into the upload folder.
+    
+    The file name is taken from the X-Filename header and the body is the file
+    itself, so Werkzeug never parses multipart data or spools it to a temporary
+    file. MAX_CONTENT_LENGTH still applies to the stream.
+    """
+    if request.mimetype in ('multipart/form-data', 'application/x-www-form-urlencoded'):
+        return jsonify({'success': False, 'error': 'Send the file as the raw request body'}), 415
+    saved, failure = _save_upload_stream(request.stream, request.headers.get('X-Filename', ''),
+                                         app.config['UPLOAD_FOLDER'])
+    if failure:
+        status = 500 if failure['reason'] == 'Save failed' else 400
+        return jsonify({'success': False, 'error': failure['reason']}), status
+    return jsonify({
+        'success': True,
+        'filename': saved['unique'],
+        'size': saved['size'],
+        'analyse_url': url_for('analyse_document', filename=saved['unique']),
+    }), 201
+
 @app.route('/api/analysis/<analysis_id>')
 @login_required
 def api_get_analysis(analysis_id):
@@ -2260,7 +2486,13 @@ def api_get_analysis(analysis_id):
     for integration with external systems or applications.
     """
     try:
-        analysis = db_operations.get_user_analysis_by_id(current_user.id, analysis_id)
+        # Optional ?fields=themes,classification limits the returned document
+        fields = {f.strip() for f in request.args.get('fields', '').split(',') if f.strip()}
+        invalid = fields - API_ANALYSIS_FIELDS
+        if invalid:
+            return jsonify({'success': False, 'error': f"Unknown fields: {', '.join(sorted(invalid))}"}), 400
+        projection = dict.fromkeys(sorted(fields), 1) or None
+        analysis = db_operations.get_user_analysis_by_id(current_user.id, analysis_id, projection=projection)
         if analysis:
             return jsonify({'success': True, 'data': analysis})
         else:
@@ -2290,21 +2522,14 @@ def internal_error(error):
 # Export view route removed - export now works directly from recommendations page
 
 def _get_export_analysis(analysis_id):
-    """Fetch analysis first from user's scope, then globally; return dict or None. Includes logging identical to original flow."""
-    logger.info("Attempting to get user's analysis...")
-    analysis = db_operations.get_user_analysis_by_id(current_user.id, analysis_id)
-    if analysis:
-        logger.info("Found analysis in user's analyses")
-        logger.info(f"Analysis details - Filename: {analysis.get('filename')}, ID: {analysis_id}")
-        return analysis
-
-    logger.info(f"{ANALYSIS_NOT_FOUND} in user's analyses, trying global lookup...")
+    """Fetch analysis by id in one query (user's own or global); return dict or None."""
     analysis = db_operations.get_analysis_by_id(analysis_id)
-    if analysis:
-        logger.info("Found analysis in global collection")
-        logger.info(f"Analysis details - Filename: {analysis.get('filename')}, ID: {analysis_id}")
-        return analysis
-    return None
+    if not analysis:
+        return None
+    scope = "user's analyses" if analysis.get('user_id') == current_user.id else "global collection"
+    logger.info(f"Found analysis in {scope}")
+    logger.info(f"Analysis details - Filename: {analysis.get('filename')}, ID: {analysis_id}")
+    return analysis
 
 # Helper functions for export view removed - no longer needed
 
@@ -2371,6 +2596,9 @@ app.jinja_env.filters["format_british_date"] = format_british_date
 from src.web.utils.template_utils import clean_literature_name
 app.jinja_env.filters["clean_literature_name"] = clean_literature_name
 
+# All filters are registered now, so every template can be compiled up front
+_warm_template_cache(app)
+
 def _flash_and_redirect(endpoint: str, message: str, category: str, **kwargs):
     """Utility: flash a message and redirect to a named endpoint."""
     flash(message, category)
@@ -2384,8 +2612,6 @@ def handle_first_login_onboarding(user_id: int) -> bool:
     the system capabilities and provide comparison benchmarks.
     """
     try:
-        from src.database.models import User
-
         user = db.session.get(User, user_id)
         if not user:
             return False
@@ -2393,7 +2619,7 @@ def handle_first_login_onboarding(user_id: int) -> bool:
         if not user.is_first_login():
             return False
 
-        logger.info(f"Starting onboarding for new user: {user.username}")
+        logger.info("Starting onboarding for new user: %s", user.username)
 
         success = db_operations.load_sample_policies_for_user(user_id)
         if success:
@@ -2401,7 +2627,7 @@ def handle_first_login_onboarding(user_id: int) -> bool:
 
         # Fallback: treat as success if baselines already exist
         if _baseline_exists_for_user(user_id):
-            logger.info("Baselines already exist; marking onboarding complete.")
+            logger.debug("Baselines already exist; marking onboarding complete.")
             return _complete_onboarding_with_message(user, "Welcome! Sample policies are already available in your dashboard.", "info")
 
         logger.warning(f"Onboarding failed for user: {user.username}")
@@ -2415,8 +2641,7 @@ def handle_first_login_onboarding(user_id: int) -> bool:
 def _baseline_exists_for_user(user_id: int) -> bool:
     """Check if user already has any baseline analyses available."""
     try:
-        user_analyses = db_operations.get_user_analyses(user_id)
-        return any(a.get('filename', '').startswith(BASELINE_PREFIX) for a in user_analyses)
+        return db_operations.has_baseline_analysis(user_id)
     except Exception as _:
         return False
 
@@ -39,9 +39,13 @@ class Config:
     # File upload configuration
     UPLOAD_FOLDER = os.path.join(os.getcwd(), 'data', 'policies', 'pdf_originals')
     PROCESSED_FOLDER = os.path.join(os.getcwd(), 'data', 'processed')
-    ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc'}
+    ALLOWED_EXTENSIONS = frozenset({'pdf', 'docx', 'doc'})
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
 
+    # Cache compiled Jinja bytecode across restarts, in Jinja's per-user temp directory
+    # (created with mode 0700 and ownership-checked, since cached bytecode is executed)
+    JINJA_BYTECODE_CACHE = os.environ.get('JINJA_BYTECODE_CACHE', 'true').lower() in ('true', '1', 't')
+
     # Session configuration
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
     SESSION_COOKIE_SECURE = False  # Set to True in production with HTTPS
@@ -67,6 +71,9 @@ class Config:
     # Application settings
     APP_NAME = "PolicyCraft"
     APP_VERSION = "1.0.0"
+    # Part of every analysis-page ETag; set per deploy (e.g. to the release tag) so
+    # template changes invalidate pages browsers have cached
+    ETAG_VERSION = os.environ.get('ETAG_VERSION', APP_VERSION)
     DEBUG = os.environ.get('FLASK_DEBUG', 'false').lower() in ('true', '1', 't')
     TESTING = False
     
@@ -101,6 +108,8 @@ class ProductionConfig(Config):
     """Production configuration."""
     DEBUG = False
     SESSION_COOKIE_SECURE = True
+    # Compiled templates are never re-checked against their source files
+    TEMPLATES_AUTO_RELOAD = False
     # Add production-specific settings here
 
 # Configuration dictionary
@@ -29,7 +29,9 @@ from src.database.mongo_operations import MongoOperations
 def export_to_csv(output_path: str):
     db = MongoOperations()
     rows = []
-    for analysis in db.get_user_analyses(-1):
+    # Only the exported fields; skips original text and the rest of each document
+    projection = {"text_data.cleaned_text": 1, "classification": 1, "metadata": 1}
+    for analysis in db.get_user_analyses(-1, projection=projection):
         cleaned = analysis.get("text_data", {}).get("cleaned_text", "")
         label = analysis.get("classification", {}).get("prediction", "")
         metadata = analysis.get("metadata", {}) or {}
@@ -30,9 +30,10 @@ import logging
 from datetime import datetime, timezone
 from typing import List, Dict, Optional, Tuple
 
-from pymongo import MongoClient, ASCENDING, DESCENDING, ReturnDocument
+from pymongo import MongoClient, ASCENDING, DESCENDING, IndexModel, ReturnDocument, UpdateOne
+from pymongo.write_concern import WriteConcern
 from pymongo.collection import Collection
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +76,12 @@ AVG_THEMES_FIELD = "avg_themes_per_analysis"
 # Matches filenames starting with "[BASELINE]"
 BASELINE_REGEX = r"^\[BASELINE\]"
 
+
+def _is_object_expr(field: str) -> Dict:
+    """Aggregation expression that is true when ``field`` holds an embedded document."""
+    return {"$eq": [{"$type": field}, "object"]}
+
+
 # Helper types for better code readability
 Analysis = Dict
 Recommendation = Dict
@@ -104,22 +111,14 @@ class MongoOperations:
             self.db = self.client[db_name]
             self.analyses: Collection = self.db["analyses"]
             self.recommendations: Collection = self.db["recommendations"]
+            self.uploaded_files: Collection = self.db["uploaded_files"]
             
             # Test connection
             self.client.admin.command('ping')
             self._connected = True
             
             # Ensure indexes for performance optimisation
-            # Non-unique index to accelerate lookup; duplicates handled at application level
-            try:
-                self.analyses.create_index([("user_id", ASCENDING), ("filename", ASCENDING)])
-            except Exception as e:
-                logger.warning("[MongoOperations] Index creation warning: %s", e)
-
-            try:
-                self.recommendations.create_index([("analysis_id", ASCENDING), ("user_id", ASCENDING)])
-            except Exception as e:
-                logger.warning("[MongoOperations] Index creation warning: %s", e)
+            self.ensure_indexes()
                 
         except Exception as e:
             logger.warning(f"[MongoOperations] Connection failed: {e}")
@@ -128,7 +127,45 @@ class MongoOperations:
             self.db = None
             self.analyses = None
             self.recommendations = None
+            self.uploaded_files = None
     
+    def ensure_indexes(self) -> None:
+        """
+        Create the indexes behind the per-request dashboard and analysis queries.
+
+        Indexes are non-unique; duplicates are handled at application level. Each
+        collection's indexes are sent in a single createIndexes round-trip, which
+        is a no-op when they already exist. Lookups by analysis id go through the
+        default ``_id`` index, so no (user_id, _id) compound is needed.
+        """
+        analysis_indexes = [
+            # Serves get_analysis_by_filename, baseline dedupe and the $match + $sort
+            # prefix of the dashboard bundle pipeline
+            IndexModel([
+                ("user_id", ASCENDING),
+                ("filename", ASCENDING),
+                ("analysis_date", DESCENDING),
+            ]),
+            # Serves get_user_analyses (newest first)
+            IndexModel([("user_id", ASCENDING), ("analysis_date", DESCENDING)]),
+        ]
+        recommendation_indexes = [
+            # Serves get_recommendations_by_analysis, the upsert in store_recommendations
+            # and (by prefix) the any-user analysis_id lookup in citation validation
+            IndexModel([("analysis_id", ASCENDING), ("user_id", ASCENDING)]),
+        ]
+        # Serves pop_uploaded_file's $in lookup when an analysis is deleted
+        uploaded_file_indexes = [
+            IndexModel([("user_id", ASCENDING), ("filename", ASCENDING)]),
+        ]
+        for collection, indexes in ((self.analyses, analysis_indexes),
+                                    (self.recommendations, recommendation_indexes),
+                                    (self.uploaded_files, uploaded_file_indexes)):
+            try:
+                collection.create_indexes(indexes)
+            except Exception as e:
+                logger.warning("[MongoOperations] Index creation warning: %s", e)
+
     def is_connected(self) -> bool:
         """Check if MongoDB connection is available."""
         return getattr(self, '_connected', False) and self.client is not None
@@ -187,8 +224,18 @@ class MongoOperations:
             )
             return str(existing["_id"])
 
-        # Build analysis document for new entry
-        analysis_doc: Analysis = {
+        analysis_doc = self._build_analysis_doc(
+            user_id, filename, original_text, cleaned_text, themes, classification, document_id, username
+        )
+        result = self.analyses.insert_one(analysis_doc)
+        return str(result.inserted_id)
+
+    @staticmethod
+    def _build_analysis_doc(user_id: int, filename: str, original_text: str, cleaned_text: str,
+                            themes: List[Dict], classification: Dict,
+                            document_id: str | None = None, username: str | None = None) -> Analysis:
+        """Build a new analysis document in the stored format."""
+        return {
             "user_id": user_id,
             "document_id": document_id,
             "filename": filename,
@@ -209,8 +256,106 @@ class MongoOperations:
             },
         }
 
-        result = self.analyses.insert_one(analysis_doc)
-        return str(result.inserted_id)
+    def store_analysis_results_bulk(self, entries: List[Dict]) -> int:
+        """
+        Upsert several analyses in one unordered bulk write.
+
+        Each entry takes the keyword arguments of store_user_analysis_results.
+        Existing (user_id, filename) documents are refreshed exactly as that
+        method does; new ones are inserted, so re-running a batch is harmless.
+
+        Args:
+            entries: Analysis field dicts to store
+
+        Returns:
+            int: Number of documents inserted or updated
+        """
+        if not entries:
+            return 0
+        if not self.is_connected():
+            logger.warning("[MongoOperations] MongoDB not available, skipping analysis storage")
+            return 0
+
+        operations = [self._build_analysis_upsert(entry) for entry in entries]
+        result = self.analyses.bulk_write(operations, ordered=False)
+        return result.upserted_count + result.modified_count
+
+    def store_user_analyses_bulk(self, entries: List[Dict]) -> List[Optional[str]]:
+        """
+        Insert or update several analyses in one unordered bulk write.
+
+        Behaves like calling store_user_analysis_results once per entry, but
+        costs one bulk write plus, when some entries refreshed existing
+        documents, one query to look up their IDs.
+
+        Args:
+            entries: Analysis field dicts, each taking the keyword arguments
+                of store_user_analysis_results
+
+        Returns:
+            List[Optional[str]]: MongoDB document IDs in the same order as entries,
+            with None for entries that failed to store
+        """
+        if not entries:
+            return []
+        if not self.is_connected():
+            logger.warning("[MongoOperations] MongoDB not available, skipping analysis storage")
+            return ["no_mongodb"] * len(entries)
+
+        operations = [self._build_analysis_upsert(entry) for entry in entries]
+        failed = set()
+        try:
+            result = self.analyses.bulk_write(operations, ordered=False)
+            upserted = result.upserted_ids.items()
+        except BulkWriteError as e:
+            # Unordered writes still apply every operation that did not fail
+            details = e.details or {}
+            failed = {error["index"] for error in details.get("writeErrors", [])}
+            upserted = [(item["index"], item["_id"]) for item in details.get("upserted", [])]
+            logger.error(f"[MongoOperations] {len(failed)} of {len(entries)} analyses failed to store: {e}")
+        ids = {index: str(_id) for index, _id in upserted}
+        ids.update(dict.fromkeys(failed))
+
+        # Updated documents are not reported by the bulk write, so fetch their IDs
+        updated = [entry for index, entry in enumerate(entries) if index not in ids]
+        if updated:
+            # Newest first, so a key with duplicate documents resolves to the one just updated
+            cursor = self.analyses.find(
+                {"$or": [{USER_ID_FIELD: e["user_id"], FILENAME_FIELD: e["filename"]} for e in updated]},
+                {USER_ID_FIELD: 1, FILENAME_FIELD: 1},
+            ).sort("analysis_date", DESCENDING)
+            existing = {}
+            for doc in cursor:
+                existing.setdefault((doc[USER_ID_FIELD], doc[FILENAME_FIELD]), str(doc["_id"]))
+            for index, entry in enumerate(entries):
+                if index not in ids:
+                    ids[index] = existing.get((entry["user_id"], entry["filename"]))
+        return [ids[index] for index in range(len(entries))]
+
+    @classmethod
+    def _build_analysis_upsert(cls, entry: Dict) -> UpdateOne:
+        """Build the (user_id, filename) upsert that stores one analysis entry."""
+        doc = cls._build_analysis_doc(**entry)
+        text_data = doc["text_data"]
+        set_fields = {
+            "analysis_date": doc["analysis_date"],
+            "themes": doc["themes"],
+            "classification": doc["classification"],
+            "text_data.cleaned_text": text_data["cleaned_text"],
+            "text_data.text_length": text_data["text_length"],
+        }
+        insert_only = {
+            "document_id": doc["document_id"],
+            "text_data.original_text": text_data["original_text"],
+            "summary": doc["summary"],
+        }
+        # An update keeps the stored username unless a new one is given
+        (set_fields if doc["username"] else insert_only)["username"] = doc["username"]
+        return UpdateOne(
+            {USER_ID_FIELD: doc["user_id"], FILENAME_FIELD: doc["filename"]},
+            {"$set": set_fields, "$setOnInsert": insert_only},
+            upsert=True,
+        )
 
     def get_analysis_by_filename(self, user_id: int, filename: str) -> Optional[Analysis]:
         """
@@ -225,50 +370,45 @@ class MongoOperations:
         """
         return self.analyses.find_one({"user_id": user_id, "filename": filename})
 
-    def get_user_analyses(self, user_id: int) -> List[Analysis]:
+    def has_baseline_analysis(self, user_id: int) -> bool:
+        """
+        Check whether the user has at least one baseline analysis.
+        
+        The anchored, case-sensitive prefix match can use the (user_id, filename)
+        index and stops at the first matching document.
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            True if a baseline analysis exists for the user
+        """
+        return self.analyses.find_one(
+            {"user_id": user_id, "filename": {"$regex": BASELINE_REGEX}},
+            projection={"_id": 1},
+        ) is not None
+
+    def get_user_analyses(self, user_id: int, projection: Optional[Dict] = None) -> List[Analysis]:
         """
         Get all analyses for a specific user ordered by analysis date (newest first).
         
         Args:
             user_id: User identifier
+            projection: Optional MongoDB projection limiting the returned fields
             
         Returns:
             List of analysis documents
         """
-        logger = logging.getLogger(__name__)
         try:
-            logger.info(f"[DEBUG] MongoOperations: Fetching analyses for user_id: {user_id}")
-            logger.info(f"[DEBUG] MongoOperations: Collection name: {self.analyses.name}")
-            logger.info(f"[DEBUG] MongoOperations: Database name: {self.db.name}")
-            
-            # Log connection status
-            logger.info(f"[DEBUG] MongoOperations: Connection status: {self.client is not None}")
-            
-            # List all collections in the database
-            try:
-                collections = self.db.list_collection_names()
-                logger.info(f"[DEBUG] MongoOperations: Available collections: {collections}")
-            except Exception as e:
-                logger.error(f"[DEBUG] MongoOperations: Error listing collections: {str(e)}")
-            
-            # Get count of analyses for this user
-            count = self.analyses.count_documents({"user_id": user_id})
-            logger.info(f"[DEBUG] MongoOperations: Found {count} analyses for user {user_id}")
-            
-            # Get the analyses
-            cursor = self.analyses.find({"user_id": user_id}).sort("analysis_date", DESCENDING)
+            # Served by the (user_id, analysis_date) index; one round-trip, no
+            # separate count or collection listing
+            cursor = self.analyses.find({"user_id": user_id}, projection).sort("analysis_date", DESCENDING)
             analyses = list(cursor)
-            
-            logger.info(f"[DEBUG] MongoOperations: Retrieved {len(analyses)} analyses")
-            if analyses:
-                logger.info(f"[DEBUG] MongoOperations: First analysis ID: {analyses[0].get('_id')}")
-                logger.info(f"[DEBUG] MongoOperations: First analysis filename: {analyses[0].get('filename')}")
-            
+            logger.debug("MongoOperations: Retrieved %d analyses for user %s", len(analyses), user_id)
             return analyses
             
         except Exception as e:
-            logger.error(f"[DEBUG] MongoOperations: Error in get_user_analyses: {str(e)}")
-            logger.error(f"[DEBUG] MongoOperations: Error type: {type(e).__name__}", exc_info=True)
+            logger.error(f"MongoOperations: Error in get_user_analyses: {str(e)}", exc_info=True)
             raise
 
     def remove_duplicate_analyses(self, user_id: int) -> int:
@@ -321,19 +461,21 @@ class MongoOperations:
         except Exception:
             return id_str
 
-    def get_user_analysis_by_id(self, user_id: int, analysis_id: str) -> Optional[Analysis]:
+    def get_user_analysis_by_id(self, user_id: int, analysis_id: str,
+                                projection: Optional[Dict] = None) -> Optional[Analysis]:
         """
         Get specific analysis by ID for a user.
         
         Args:
             user_id: User identifier
             analysis_id: Analysis document ID
+            projection: Optional MongoDB projection limiting the returned fields
             
         Returns:
             Analysis document or None if not found
         """
         oid = self._to_object_id(analysis_id)
-        return self.analyses.find_one({"_id": oid, "user_id": user_id})
+        return self.analyses.find_one({"_id": oid, "user_id": user_id}, projection)
 
     def delete_user_analysis(self, user_id: int, analysis_id: str) -> bool:
         """
@@ -354,18 +496,19 @@ class MongoOperations:
         })
         return result.deleted_count == 1
 
-    def get_analysis_by_id(self, analysis_id: str) -> Optional[Analysis]:
+    def get_analysis_by_id(self, analysis_id: str, projection: Optional[Dict] = None) -> Optional[Analysis]:
         """
         Generic fetch without user filter (used by API endpoints).
         
         Args:
             analysis_id: Analysis document ID
+            projection: Optional MongoDB projection limiting the returned fields
             
         Returns:
             Analysis document or None if not found
         """
         oid = self._to_object_id(analysis_id)
-        return self.analyses.find_one({"_id": oid})
+        return self.analyses.find_one({"_id": oid}, projection)
 
     # Statistics and aggregation methods
 
@@ -399,6 +542,87 @@ class MongoOperations:
             "avg_themes_per_analysis": round(doc.get("avg_themes_per_analysis", 0), 1),
         }
 
+    def get_dashboard_bundle(self, user_id: int) -> Dict:
+        """
+        Fetch everything the dashboard needs in a single aggregation round-trip.
+
+        User analyses and global baselines (user_id == -1) are merged per
+        filename, preferring the user's own (newest) document, and the merged
+        set is summarised with $facet.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Dict with 'analyses' (newest first, without 'text_data'), raw 'classification_counts',
+            'theme_frequencies' and 'statistics' for the merged set
+        """
+        pipeline = [
+            {MATCH_QUERY: {
+                USER_ID_FIELD: {IN_OPERATOR: [user_id, -1]},
+                FILENAME_FIELD: {"$nin": [None, ""]},
+            }},
+            # User rows sort ahead of baseline rows (-1), newest first within each
+            {SORT_QUERY: {USER_ID_FIELD: DESCENDING, ANALYSIS_DATE_FIELD: DESCENDING}},
+            # The dashboard never shows document text; drop it before grouping
+            {"$project": {"text_data": 0}},
+            {GROUP_QUERY: {ID_FIELD: f"${FILENAME_FIELD}", "doc": {"$first": "$$ROOT"}}},
+            {"$replaceRoot": {"newRoot": "$doc"}},
+            {"$facet": {
+                "analyses": [{SORT_QUERY: {ANALYSIS_DATE_FIELD: DESCENDING}}],
+                "classification_counts": [
+                    {GROUP_QUERY: {
+                        ID_FIELD: {"$cond": [
+                            _is_object_expr(f"${CLASSIFICATION_FIELD}"),
+                            f"${CLASSIFICATION_FIELD}.classification",
+                            f"${CLASSIFICATION_FIELD}",
+                        ]},
+                        COUNT_FIELD: {SUM_OPERATOR: 1},
+                    }},
+                ],
+                "theme_frequencies": [
+                    {MATCH_QUERY: {THEMES_FIELD: {"$type": "array"}}},
+                    {"$unwind": f"${THEMES_FIELD}"},
+                    {GROUP_QUERY: {
+                        ID_FIELD: {"$cond": [
+                            _is_object_expr(f"${THEMES_FIELD}"),
+                            {"$ifNull": [f"${THEMES_FIELD}.name", "Unknown"]},
+                            f"${THEMES_FIELD}",
+                        ]},
+                        COUNT_FIELD: {SUM_OPERATOR: 1},
+                    }},
+                ],
+                "statistics": [
+                    {GROUP_QUERY: {
+                        ID_FIELD: None,
+                        TOTAL_FIELD: {SUM_OPERATOR: 1},
+                        AVG_CONFIDENCE_FIELD: {AVG_OPERATOR: f"${CLASSIFICATION_FIELD}.{CONFIDENCE_FIELD}"},
+                        AVG_THEMES_FIELD: {AVG_OPERATOR: {"$cond": [
+                            {"$isArray": f"${THEMES_FIELD}"}, {SIZE_OPERATOR: f"${THEMES_FIELD}"}, 0
+                        ]}},
+                    }},
+                ],
+            }},
+        ]
+        facets = next(self.analyses.aggregate(pipeline), {})
+
+        stats_docs = facets.get("statistics") or [{}]
+        stats = stats_docs[0]
+        return {
+            "analyses": facets.get("analyses", []),
+            "classification_counts": {
+                doc[ID_FIELD]: doc[COUNT_FIELD] for doc in facets.get("classification_counts", [])
+            },
+            "theme_frequencies": {
+                str(doc[ID_FIELD]): doc[COUNT_FIELD] for doc in facets.get("theme_frequencies", [])
+            },
+            "statistics": {
+                TOTAL_FIELD: stats.get(TOTAL_FIELD, 0),
+                AVG_CONFIDENCE_FIELD: round(stats.get(AVG_CONFIDENCE_FIELD) or 0, 1),
+                AVG_THEMES_FIELD: round(stats.get(AVG_THEMES_FIELD) or 0, 1),
+            },
+        }
+
     # Recommendations management
 
     def get_recommendations_by_analysis(self, user_id: int, analysis_id: str):
@@ -412,7 +636,10 @@ class MongoOperations:
         Returns:
             List of recommendations or None if not found
         """
-        doc = self.recommendations.find_one({"user_id": user_id, "analysis_id": analysis_id})
+        doc = self.recommendations.find_one(
+            {"user_id": user_id, "analysis_id": analysis_id},
+            projection={"_id": 0, "recommendations": 1},
+        )
         if doc:
             return doc.get("recommendations", [])
         return None
@@ -429,14 +656,50 @@ class MongoOperations:
         Returns:
             str: MongoDB document ID of stored recommendations
         """
-        payload = {
-            USER_ID_FIELD: user_id,
-            ANALYSIS_ID_FIELD: analysis_id,
-            "recommendations": recs,
-            "created_at": datetime.now(timezone.utc),
-        }
-        result = self.recommendations.insert_one(payload)
-        return str(result.inserted_id)
+        # Recommendations can be regenerated at any time, so a journal flush is
+        # not worth waiting for; re-storing replaces the previous set in place.
+        collection = self.recommendations.with_options(write_concern=WriteConcern(w=1, j=False))
+        doc = collection.find_one_and_update(
+            {USER_ID_FIELD: user_id, ANALYSIS_ID_FIELD: analysis_id},
+            {"$set": {"recommendations": recs, "created_at": datetime.now(timezone.utc)}},
+            projection={"_id": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return str(doc["_id"])
+
+    # Uploaded file metadata
+
+    def record_uploaded_file(self, user_id: int, filename: str, path: str, size: int) -> None:
+        """
+        Remember where an uploaded file was saved so deletion does not probe the disk.
+        
+        Args:
+            user_id: User identifier
+            filename: Stored (unique) filename
+            path: Absolute or upload-folder path the file was written to
+            size: File size in bytes
+        """
+        self.uploaded_files.update_one(
+            {USER_ID_FIELD: user_id, "filename": filename},
+            {"$set": {"path": path, "size": size, "uploaded_at": datetime.now(timezone.utc)}},
+            upsert=True,
+        )
+
+    def pop_uploaded_file(self, user_id: int, filenames: List[str]) -> Optional[Dict]:
+        """
+        Remove and return the upload record matching any of the candidate filenames.
+        
+        Args:
+            user_id: User identifier
+            filenames: Candidate stored filenames for the analysis
+            
+        Returns:
+            The removed record (with its ``path``) or None if none was recorded
+        """
+        return self.uploaded_files.find_one_and_delete(
+            {USER_ID_FIELD: user_id, "filename": {"$in": filenames}}
+        )
 
     # User data cleanup helpers
 
@@ -491,6 +754,7 @@ class MongoOperations:
         # Delete from MongoDB
         res1 = self.analyses.delete_many({"user_id": user_id})
         res2 = self.recommendations.delete_many({"user_id": user_id})
+        self.uploaded_files.delete_many({"user_id": user_id})
         
         print(f"SECURITY FIX: Purged {res1.deleted_count} analyses, {res2.deleted_count} recommendations, and {len(deleted_files)} files for user {user_id}")
         if deleted_files:
@@ -142,9 +142,9 @@ class PolicyClassifier:
             for group_name, keywords in groups.items():
                 weight = self.category_weights[category].get(group_name, 1.0)
                 for kw in keywords:
-                    if kw in text_lower:
-                        # simple frequency * weight
-                        freq = text_lower.count(kw)
+                    # simple frequency * weight; one count() scan doubles as the presence test
+                    freq = text_lower.count(kw)
+                    if freq:
                         score = freq * weight
                         if score > 0:
                             scores.append((kw, category, score))
@@ -0,0 +1,200 @@
+"""
+Document Text Extraction for PolicyCraft AI Policy Analysis Platform.
+
+This module wraps TextProcessor extraction with the size checks and placeholder
+fallbacks the web application relies on, and runs that extraction in a small
+worker process pool for the CPU-bound PDF/DOCX parsing of several documents.
+
+Key Features:
+- Single-document extraction that always returns usable (possibly placeholder) text
+- Worker processes started through forkserver or spawn, never forked from the
+  threaded web process
+- Per-document timeouts; failed or timed-out documents are left to the caller
+- Automatic replacement of crashed workers and of a pool stuck on a document
+
+Author: Jacek Robert Kszczot
+Project: MSc Data Science & AI - COM7016
+University: Leeds Trinity University
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from typing import List, Optional, Sequence
+
+from .text_processor import TextProcessor
+
+logger = logging.getLogger(__name__)
+
+# Below this many characters an extraction is logged as insufficient
+MIN_EXTRACTED_LENGTH = 50
+# Below this many characters the text is replaced with a placeholder
+MIN_USABLE_LENGTH = 20
+
+
+def extract_text_with_fallback(file_path: str, university_name: str, processor) -> str:
+    """
+    Extract text with size checks, returning placeholder text on failure.
+
+    Args:
+        file_path: Path of the PDF/DOCX/TXT document
+        university_name: Institution name used in placeholder text
+        processor: TextProcessor (or compatible) used for the extraction
+
+    Returns:
+        str: Non-empty text, which may be a placeholder
+    """
+    try:
+        # One stat call both checks existence and gives the size
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
+            logger.error(f"File does not exist: {file_path}")
+            raise FileNotFoundError(f"File not found: {file_path}")
+        if file_size == 0:
+            logger.warning(f"Empty file detected: {file_path} (0 bytes)")
+            raise ValueError(f"Empty file: {file_path}")
+
+        logger.info(f"Attempting to extract text from {file_path} ({file_size} bytes)")
+        extracted_text = processor.extract_text_from_file(file_path)
+        text_length = len(extracted_text) if extracted_text else 0
+        logger.info(f"Extracted {text_length} characters from {file_path}")
+
+        # extract_text_from_file already tries PyPDF2, pdfplumber and OCR (or every DOCX
+        # paragraph and table), so re-reading the file here cannot recover more text
+        if not extracted_text or text_length < MIN_EXTRACTED_LENGTH:
+            logger.warning(f"Insufficient text extracted from {file_path} ({text_length} chars)")
+
+        return _ensure_minimal_text(extracted_text, file_path, university_name)
+    except Exception as e:
+        logger.error(f"Text extraction failed for {file_path}: {e}")
+        return _placeholder_text(university_name, e)
+
+
+def _placeholder_text(university_name: str, reason) -> str:
+    """Placeholder used in place of a document that could not be processed."""
+    return (
+        f"AI Policy document from {university_name}. This is a placeholder text as the original document "
+        f"could not be processed due to: {reason}"
+    )
+
+
+def _ensure_minimal_text(extracted_text: Optional[str], file_path: str, university_name: str) -> str:
+    """Ensure minimal placeholder text if extraction fails or is too short."""
+    if not extracted_text or len(extracted_text) < MIN_USABLE_LENGTH:
+        logger.warning(f"Using minimal placeholder text for {file_path}")
+        return (
+            f"AI Policy document from {university_name}. This is a placeholder text as the original document "
+            f"could not be fully processed."
+        )
+    return extracted_text
+
+
+# Each worker process builds its own TextProcessor on first use
+_worker_processor = None
+
+
+def _extract_in_worker(file_path: str, university_name: str) -> str:
+    """Worker entry point: extract one document with this process's TextProcessor."""
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = TextProcessor()
+    return extract_text_with_fallback(file_path, university_name, _worker_processor)
+
+
+def _pool_context():
+    """Start workers from a clean process rather than forking the threaded caller."""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+class ExtractionPool:
+    """
+    Process pool for extracting several documents in parallel.
+
+    Built on multiprocessing.Pool, which replaces a worker that dies and whose
+    terminate() stops workers stuck on a document. The pool is created on first
+    use and rebuilt after a timed-out document, so one bad file does not disable
+    parallel extraction for the rest of the process lifetime.
+    """
+
+    def __init__(self, max_workers: int, timeout: float):
+        """
+        Args:
+            max_workers: Number of worker processes
+            timeout: Seconds to wait for each document before giving up on the pool
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = None
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = _pool_context().Pool(processes=self.max_workers)
+            return self._pool
+
+    def _discard(self, pool) -> None:
+        """Terminate a stuck pool so the next call builds a fresh one."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.terminate()
+
+    def extract_many(self, paths: Sequence[str], names: Sequence[str],
+                     placeholder_on_timeout: bool = False) -> List[Optional[str]]:
+        """
+        Extract several documents in worker processes.
+
+        A document that is not finished within the timeout (including one whose
+        worker crashed, as its result never arrives) terminates the pool; documents
+        already extracted are kept.
+
+        Args:
+            paths: Document paths
+            names: Institution names for placeholder text, one per path
+            placeholder_on_timeout: Return placeholder text for the timed-out document
+                instead of None, so a caller that cannot wait does not retry it inline
+
+        Returns:
+            List[Optional[str]]: One entry per path in input order; None marks a
+            document that failed or timed out, which the caller should extract itself
+        """
+        results: List[Optional[str]] = [None] * len(paths)
+        try:
+            pool = self._get_pool()
+            pending = [pool.apply_async(_extract_in_worker, (path, name)) for path, name in zip(paths, names)]
+        except Exception as e:
+            logger.warning(f"Could not submit documents for parallel extraction: {e}")
+            return results
+
+        for index, result in enumerate(pending):
+            try:
+                results[index] = result.get(timeout=self.timeout)
+            except multiprocessing.TimeoutError:
+                logger.warning(f"Extraction timed out after {self.timeout}s, restarting pool: {paths[index]}")
+                if placeholder_on_timeout:
+                    results[index] = _placeholder_text(names[index], f"extraction timed out after {self.timeout}s")
+                # Keep anything that finished before the pool is terminated
+                for later, other in enumerate(pending[index + 1:], start=index + 1):
+                    if other.ready() and other.successful():
+                        results[later] = other.get()
+                self._discard(pool)
+                break
+            except Exception as e:
+                logger.warning(f"Parallel extraction failed for {paths[index]}: {e}")
+        return results
+
+    def shutdown(self) -> None:
+        """Stop the worker processes without waiting for queued documents."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
@@ -16,6 +16,9 @@ from typing import List, Dict, Any, Optional
 PROFESSIONAL_DEVELOPMENT = 'professional development'
 RISK_ASSESSMENT = 'risk assessment'
 
+# Word runs as delimited by \b; used to tally document tokens for keyword counting
+_WORD_RE = re.compile(r'\w+')
+
 # NLP libraries
 try:
     import spacy
@@ -567,12 +570,59 @@ class ThemeExtractor:
             }
         }
         
+        # Compile keyword/pattern regexes once; there are more of them than re's cache holds
+        self._compile_theme_regexes()
+        
         # Initialise spaCy if available
         if SPACY_AVAILABLE:
             self._initialize_spacy()
         else:
             print("spaCy not available - using fallback keyword extraction")
             
+    def _compile_theme_regexes(self) -> None:
+        """
+        Precompile the keyword and pattern matchers used for frequency counting.
+        
+        Both extraction paths count every theme keyword in every document.
+        Single-word terms are counted from one token tally of the text; other
+        terms keep a compiled word-boundary regex, only run when all of their
+        words occur in the text. Also builds the pattern-name to theme-name
+        lookup used by the PhraseMatcher.
+        """
+        def term_matcher(label: str, term: str):
+            tokens = tuple(_WORD_RE.findall(term))
+            if len(tokens) == 1 and tokens[0] == term:
+                return label, tokens, None
+            return label, tokens, re.compile(r'\b' + re.escape(term) + r'\b')
+        
+        self._keyword_matchers = {
+            theme_name: [term_matcher(keyword, keyword) for keyword in theme_data['keywords']]
+            for theme_name, theme_data in self.theme_categories.items()
+        }
+        self._pattern_matchers = {
+            theme_name: [term_matcher(pattern, pattern.lower()) for pattern in theme_data['patterns']]
+            for theme_name, theme_data in self.theme_categories.items()
+        }
+        self._pattern_to_theme = {
+            theme_name.lower().replace(' ', '_'): theme_name
+            for theme_name in self.theme_categories.keys()
+        }
+
+    @staticmethod
+    def _count_term(tokens, regex, text_lower: str, token_counts: Counter) -> int:
+        """
+        Count whole-word occurrences of a precompiled term in lowercased text.
+        
+        Equivalent to ``len(re.findall(r'\\b' + re.escape(term) + r'\\b', text_lower))``:
+        every word run inside a bounded match is itself a whole token of the
+        text, so a term with a missing token cannot match.
+        """
+        if regex is None:
+            return token_counts.get(tokens[0], 0)
+        if not all(token in token_counts for token in tokens):
+            return 0
+        return len(regex.findall(text_lower))
+
     def _initialize_spacy(self) -> None:
         """
         Initialise the spaCy NLP pipeline and configure pattern matchers.
@@ -673,6 +723,38 @@ class ThemeExtractor:
         print(f"Extracted {len(themes)} themes")
         return themes
 
+    def extract_themes_batch(self, texts: List[str], min_frequency: int = 1, max_themes: int = 15,
+                             batch_size: int = 16) -> List[List[Dict]]:
+        """
+        Extract themes from several policy texts in one pass.
+        
+        Produces the same output as calling extract_themes() on each text, but
+        streams the texts through ``nlp.pipe`` so spaCy can batch its pipeline
+        work instead of paying the per-document call overhead.
+        
+        Args:
+            texts: Policy texts to analyse. Empty entries yield an empty list.
+            min_frequency: Minimum number of keyword matches required for a theme.
+            max_themes: Maximum number of themes to return per text.
+            batch_size: Number of texts spaCy processes per batch.
+            
+        Returns:
+            One list of theme dictionaries per input text, in input order.
+        """
+        results: List[List[Dict]] = [[] for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text]
+        
+        if self.nlp:
+            docs = self.nlp.pipe((texts[i] for i in indices), batch_size=batch_size)
+            for i, doc in zip(indices, docs):
+                results[i] = self._score_themes_doc(doc, texts[i], min_frequency, max_themes)
+        else:
+            for i in indices:
+                results[i] = self._extract_themes_keywords(texts[i], min_frequency, max_themes)
+        
+        print(f"Extracted themes for {len(indices)} texts in batch")
+        return results
+
     def _extract_themes_spacy(self, text: str, min_frequency: int, max_themes: int) -> List[Dict]:
         """
         Extract themes from text using the spaCy NLP pipeline.
@@ -697,8 +779,14 @@ class ThemeExtractor:
             This is an internal method and should not be called directly.
             Use the public extract_themes() method instead.
         """
-        doc = self.nlp(text)
+        return self._score_themes_doc(self.nlp(text), text, min_frequency, max_themes)
+
+    def _score_themes_doc(self, doc, text: str, min_frequency: int, max_themes: int) -> List[Dict]:
+        """
+        Score themes for an already parsed spaCy ``Doc`` of ``text``.
         
+        Shared by the single-text and batched (``nlp.pipe``) extraction paths.
+        """
         # Theme scores
         theme_scores = defaultdict(float)
         theme_details = defaultdict(lambda: {'matches': [], 'entities': [], 'keywords': []})
@@ -713,13 +801,15 @@ class ThemeExtractor:
                 theme_details[theme_name]['matches'].append(matched_text)
         
         # 2. Keyword frequency analysis
-        for theme_name, theme_data in self.theme_categories.items():
+        text_lower = text.lower()
+        token_counts = Counter(_WORD_RE.findall(text_lower))
+        for theme_name, keyword_matchers in self._keyword_matchers.items():
             keyword_count = 0
             found_keywords = []
             
-            for keyword in theme_data['keywords']:
+            for keyword, tokens, regex in keyword_matchers:
                 # Count occurrences (case-insensitive)
-                count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text.lower()))
+                count = self._count_term(tokens, regex, text_lower, token_counts)
                 if count > 0:
                     keyword_count += count
                     found_keywords.append((keyword, count))
@@ -765,20 +855,21 @@ class ThemeExtractor:
         theme_details = defaultdict(lambda: {'keywords': [], 'matches': []})
         
         # Keyword frequency analysis
-        for theme_name, theme_data in self.theme_categories.items():
+        token_counts = Counter(_WORD_RE.findall(text_lower))
+        for theme_name, keyword_matchers in self._keyword_matchers.items():
             keyword_count = 0
             found_keywords = []
             
             # Check keywords
-            for keyword in theme_data['keywords']:
-                count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text_lower))
+            for keyword, tokens, regex in keyword_matchers:
+                count = self._count_term(tokens, regex, text_lower, token_counts)
                 if count > 0:
                     keyword_count += count
                     found_keywords.append((keyword, count))
             
             # Check patterns
-            for pattern in theme_data['patterns']:
-                count = len(re.findall(r'\b' + re.escape(pattern.lower()) + r'\b', text_lower))
+            for pattern, tokens, regex in self._pattern_matchers[theme_name]:
+                count = self._count_term(tokens, regex, text_lower, token_counts)
                 if count > 0:
                     keyword_count += count * 2  # Higher weight for patterns
                     theme_details[theme_name]['matches'].append((pattern, count))
@@ -807,11 +898,7 @@ class ThemeExtractor:
             >>> self._get_theme_from_pattern('academic_integrity')
             'Academic Integrity'
         """
-        pattern_to_theme = {
-            theme_name.lower().replace(' ', '_'): theme_name 
-            for theme_name in self.theme_categories.keys()
-        }
-        return pattern_to_theme.get(pattern_name)
+        return self._pattern_to_theme.get(pattern_name)
 
     def _format_themes(self, theme_scores: Dict, theme_details: Dict, max_themes: int) -> List[Dict]:
         """
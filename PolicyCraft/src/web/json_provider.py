@@ -0,0 +1,73 @@
+"""
+JSON Provider for PolicyCraft AI Policy Analysis Platform.
+
+This module provides an orjson-backed replacement for Flask's default JSON
+provider so that ``jsonify`` and ``request.get_json`` use a compiled encoder
+for the larger analysis and recommendation payloads.
+
+Key Features:
+- orjson serialisation with Flask-compatible output (sorted keys, HTTP dates)
+- MongoDB ObjectId values serialised as strings, so raw documents can be returned
+- Fallback to Flask's own encoder for types orjson does not handle
+- Optional dependency: a stdlib-based provider is used when orjson is missing
+
+Author: Jacek Robert Kszczot
+Project: MSc Data Science & AI - COM7016
+University: Leeds Trinity University
+"""
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+try:
+    from bson import ObjectId
+except ImportError:  # pragma: no cover - pymongo is a core dependency
+    ObjectId = None
+
+
+def _default(o):
+    """Serialise MongoDB ObjectIds as strings, otherwise defer to Flask."""
+    if ObjectId is not None and isinstance(o, ObjectId):
+        return str(o)
+    return DefaultJSONProvider.default(o)
+
+
+class PolicyCraftJSONProvider(DefaultJSONProvider):
+    """Flask's stdlib JSON provider with ObjectId support."""
+
+    default = staticmethod(_default)
+
+
+class OrjsonProvider(PolicyCraftJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        # Datetimes are passed through so they keep Flask's HTTP date format
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def init_json_provider(app):
+    """Install the orjson provider on the app, or the stdlib one without orjson.
+
+    Args:
+        app: The Flask application instance
+
+    Returns:
+        bool: True if the orjson provider was installed
+    """
+    if orjson is None:
+        app.json = PolicyCraftJSONProvider(app)
+        return False
+    app.json = OrjsonProvider(app)
+    return True
@@ -28,10 +28,12 @@ def mongo_db():
     # Ensure isolation
     db.analyses.delete_many({})
     db.recommendations.delete_many({})
+    db.uploaded_files.delete_many({})
     yield db
     # Cleanup
     db.analyses.delete_many({})
     db.recommendations.delete_many({})
+    db.uploaded_files.delete_many({})
 
 
 def test_store_and_fetch_analysis(mongo_db):
@@ -63,3 +65,131 @@ def test_store_and_fetch_recommendations(mongo_db):
     mongo_db.store_recommendations(1, analysis_id, recs)
     fetched = mongo_db.get_recommendations_by_analysis(1, analysis_id)
     assert fetched and fetched[0]["text"].startswith("Improve")
+
+
+def test_store_recommendations_replaces_previous_set(mongo_db):
+    analysis_id = mongo_db.store_user_analysis_results(
+        user_id=1,
+        filename="sample.txt",
+        original_text="o",
+        cleaned_text="c",
+        themes=[],
+        classification={"classification": "Low", "confidence": 70},
+    )
+    first = mongo_db.store_recommendations(1, analysis_id, [{"text": "Old"}])
+    second = mongo_db.store_recommendations(1, analysis_id, [{"text": "New"}])
+    assert first == second
+    assert mongo_db.get_recommendations_by_analysis(1, analysis_id) == [{"text": "New"}]
+
+
+def test_dashboard_bundle_prefers_user_analysis(mongo_db):
+    for user_id, cls in ((-1, "Restrictive"), (7, "Permissive")):
+        mongo_db.store_user_analysis_results(
+            user_id=user_id,
+            filename="[BASELINE] Shared",
+            original_text="o",
+            cleaned_text="c",
+            themes=[{"name": "Privacy", "score": 0.5, "confidence": 60}],
+            classification={"classification": cls, "confidence": 60},
+        )
+    bundle = mongo_db.get_dashboard_bundle(7)
+    shared = [a for a in bundle["analyses"] if a["filename"] == "[BASELINE] Shared"]
+    assert len(shared) == 1 and shared[0]["user_id"] == 7
+    assert "text_data" not in shared[0]
+    assert bundle["classification_counts"].get("Permissive") == 1
+    assert bundle["theme_frequencies"].get("Privacy") == 1
+    assert bundle["statistics"]["total"] == len(bundle["analyses"])
+
+
+def test_ensure_indexes_covers_hot_queries(mongo_db):
+    mongo_db.ensure_indexes()
+    keys = [tuple(ix["key"]) for ix in mongo_db.analyses.index_information().values()]
+    assert (("user_id", 1), ("filename", 1), ("analysis_date", -1)) in keys
+    assert (("user_id", 1), ("analysis_date", -1)) in keys
+    rec_keys = [tuple(ix["key"]) for ix in mongo_db.recommendations.index_information().values()]
+    assert (("analysis_id", 1), ("user_id", 1)) in rec_keys
+    file_keys = [tuple(ix["key"]) for ix in mongo_db.uploaded_files.index_information().values()]
+    assert (("user_id", 1), ("filename", 1)) in file_keys
+
+
+def test_has_baseline_analysis(mongo_db):
+    assert not mongo_db.has_baseline_analysis(99)
+    mongo_db.store_user_analysis_results(
+        user_id=99,
+        filename="[BASELINE] Example University",
+        original_text="o",
+        cleaned_text="c",
+        themes=[],
+        classification={"classification": "Moderate", "confidence": 60},
+    )
+    assert mongo_db.has_baseline_analysis(99)
+
+
+def test_pop_uploaded_file_resolves_candidate_once(mongo_db):
+    mongo_db.record_uploaded_file(3, "3_20240101_policy.pdf", "/tmp/3_20240101_policy.pdf", 42)
+    record = mongo_db.pop_uploaded_file(3, ["policy.pdf", "3_20240101_policy.pdf"])
+    assert record["path"] == "/tmp/3_20240101_policy.pdf"
+    assert mongo_db.pop_uploaded_file(3, ["3_20240101_policy.pdf"]) is None
+
+
+def test_store_analysis_results_bulk_upserts(mongo_db):
+    entry = {
+        "user_id": -1,
+        "filename": "[BASELINE] Bulk",
+        "original_text": "o",
+        "cleaned_text": "c",
+        "themes": [{"name": "Privacy", "score": 0.5, "confidence": 60}],
+        "classification": {"classification": "Moderate", "confidence": 60},
+        "document_id": "bulk.pdf",
+    }
+    assert mongo_db.store_analysis_results_bulk([entry]) == 1
+    entry["classification"] = {"classification": "Restrictive", "confidence": 80}
+    mongo_db.store_analysis_results_bulk([entry])
+    stored = mongo_db.analyses.find({"user_id": -1, "filename": "[BASELINE] Bulk"})
+    docs = list(stored)
+    assert len(docs) == 1
+    assert docs[0]["classification"]["classification"] == "Restrictive"
+    assert docs[0]["document_id"] == "bulk.pdf"
+
+
+def test_store_user_analyses_bulk_returns_ids_in_order(mongo_db):
+    existing_id = mongo_db.store_user_analysis_results(
+        user_id=4, filename="4_b.pdf", original_text="o", cleaned_text="c",
+        themes=[], classification={"classification": "Moderate", "confidence": 50},
+    )
+    entries = [
+        {"user_id": 4, "filename": name, "original_text": "o", "cleaned_text": "c",
+         "themes": [], "classification": {"classification": "Permissive", "confidence": 70}}
+        for name in ("4_a.pdf", "4_b.pdf")
+    ]
+    ids = mongo_db.store_user_analyses_bulk(entries)
+    assert len(ids) == 2
+    assert ids[1] == existing_id
+    assert mongo_db.get_analysis_by_id(ids[0])["filename"] == "4_a.pdf"
+    assert mongo_db.analyses.count_documents({"user_id": 4}) == 2
+
+
+def test_store_user_analyses_bulk_reports_failed_entries(mongo_db):
+    # A scalar text_data makes the "text_data.cleaned_text" update fail for this file only
+    mongo_db.analyses.insert_one({"user_id": 5, "filename": "5_bad.pdf", "text_data": "not a document"})
+    entries = [
+        {"user_id": 5, "filename": name, "original_text": "o", "cleaned_text": "c",
+         "themes": [], "classification": {"classification": "Moderate", "confidence": 50}}
+        for name in ("5_ok.pdf", "5_bad.pdf")
+    ]
+    ids = mongo_db.store_user_analyses_bulk(entries)
+    assert ids[1] is None
+    assert mongo_db.get_analysis_by_id(ids[0])["filename"] == "5_ok.pdf"
+
+
+def test_store_user_analyses_bulk_returns_newest_duplicate(mongo_db):
+    from datetime import datetime, timezone
+    mongo_db.analyses.insert_many([
+        {"user_id": 6, "filename": "6_dup.pdf", "analysis_date": datetime(2020, 1, 1, tzinfo=timezone.utc)},
+        {"user_id": 6, "filename": "6_dup.pdf", "analysis_date": datetime(2021, 1, 1, tzinfo=timezone.utc)},
+    ])
+    entry = {"user_id": 6, "filename": "6_dup.pdf", "original_text": "o", "cleaned_text": "c",
+             "themes": [], "classification": {"classification": "Moderate", "confidence": 50}}
+    [analysis_id] = mongo_db.store_user_analyses_bulk([entry])
+    newest = mongo_db.analyses.find({"user_id": 6}).sort("analysis_date", -1).limit(1)[0]
+    assert analysis_id == str(newest["_id"])
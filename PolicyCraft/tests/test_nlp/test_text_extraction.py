@@ -0,0 +1,128 @@
+"""
+Test Suite for PolicyCraft Document Text Extraction
+
+This module tests the extraction helpers shared by the web application's baseline
+backfill and batch analysis: placeholder fallbacks for unusable documents and the
+worker process pool used to extract several documents at once.
+
+Test Coverage:
+- Extraction of readable documents
+- Placeholder text for missing, empty and failing documents
+- Parallel extraction results in input order
+- Recovery of the pool after a worker crash or a timed-out document
+
+Author: Jacek Robert Kszczot
+Project: MSc Data Science & AI - COM7016
+University: Leeds Trinity University
+"""
+
+import os
+import tempfile
+import time
+
+import pytest
+
+from src.nlp.text_extraction import ExtractionPool, extract_text_with_fallback
+from src.nlp.text_processor import TextProcessor
+
+
+class _FailingProcessor:
+    """Stand-in processor whose extraction always raises."""
+
+    def extract_text_from_file(self, file_path):
+        raise RuntimeError("parser exploded")
+
+
+@pytest.fixture
+def empty_file():
+    """Create an empty temporary document."""
+    with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
+        temp_path = f.name
+    yield temp_path
+    os.unlink(temp_path)
+
+
+class TestExtractTextWithFallback:
+    """Test single-document extraction with placeholder fallbacks."""
+
+    def test_extracts_readable_file(self, temp_policy_file):
+        """Readable documents return their own text."""
+        text = extract_text_with_fallback(temp_policy_file, "Test University", TextProcessor())
+        assert "placeholder" not in text
+        assert len(text) > 50
+
+    def test_missing_file_returns_placeholder(self):
+        """Missing documents return placeholder text naming the institution."""
+        text = extract_text_with_fallback("/nonexistent/policy.pdf", "Test University", TextProcessor())
+        assert "Test University" in text
+        assert "placeholder" in text
+
+    def test_empty_file_returns_placeholder(self, empty_file):
+        """Empty documents are not handed to the processor."""
+        text = extract_text_with_fallback(empty_file, "Test University", _FailingProcessor())
+        assert "Empty file" in text
+
+    def test_processor_error_returns_placeholder(self, temp_policy_file):
+        """Processor exceptions are reported in the placeholder instead of raised."""
+        text = extract_text_with_fallback(temp_policy_file, "Test University", _FailingProcessor())
+        assert "parser exploded" in text
+
+
+class TestExtractionPool:
+    """Test parallel extraction in worker processes."""
+
+    def test_extract_many_keeps_input_order(self, temp_policy_file, temp_pdf_file):
+        """Results line up with the input paths."""
+        pool = ExtractionPool(max_workers=2, timeout=60)
+        try:
+            results = pool.extract_many(
+                [temp_policy_file, "/nonexistent/policy.pdf", temp_pdf_file],
+                ["First", "Second", "Third"],
+            )
+        finally:
+            pool.shutdown()
+
+        assert len(results) == 3
+        assert "placeholder" not in results[0]
+        assert "Second" in results[1]
+        assert "placeholder" not in results[2]
+
+    def test_crashed_worker_is_replaced(self, temp_policy_file):
+        """A worker that dies is replaced and later documents still extract."""
+        pool = ExtractionPool(max_workers=1, timeout=60)
+        try:
+            pool._get_pool().apply_async(os._exit, (1,))
+            results = pool.extract_many([temp_policy_file, temp_policy_file], ["A", "B"])
+        finally:
+            pool.shutdown()
+
+        assert all(results)
+
+    def test_stuck_pool_times_out_and_is_rebuilt(self, temp_policy_file):
+        """A timed-out document terminates the pool instead of blocking the caller."""
+        pool = ExtractionPool(max_workers=1, timeout=1)
+        try:
+            # Occupy the only worker so the documents queue behind it
+            pool._get_pool().apply_async(time.sleep, (60,))
+            started = time.monotonic()
+            assert pool.extract_many([temp_policy_file, temp_policy_file], ["A", "B"]) == [None, None]
+            assert time.monotonic() - started < 30
+
+            results = pool.extract_many([temp_policy_file, temp_policy_file], ["A", "B"])
+        finally:
+            pool.shutdown()
+
+        assert all(results)
+
+    def test_timed_out_document_can_get_placeholder(self, temp_policy_file):
+        """Callers that cannot wait get placeholder text for the timed-out document."""
+        pool = ExtractionPool(max_workers=1, timeout=1)
+        try:
+            pool._get_pool().apply_async(time.sleep, (60,))
+            results = pool.extract_many([temp_policy_file, temp_policy_file], ["A", "B"],
+                                        placeholder_on_timeout=True)
+        finally:
+            pool.shutdown()
+
+        assert "timed out" in results[0]
+        assert results[1] is None
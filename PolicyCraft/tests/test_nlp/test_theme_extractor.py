@@ -123,3 +123,33 @@ class TestThemeExtractor:
         """Test string representation of theme extractor."""
         str_repr = str(theme_extractor)
         assert str_repr is not None
+
+    def test_extract_themes_batch_matches_single_calls(self, theme_extractor):
+        """Test that batched extraction returns the same themes as per-text calls, in order."""
+        texts = [
+            "Students must disclose AI use to protect academic integrity and avoid plagiarism.",
+            "",
+            "Staff should protect personal data and privacy when using generative AI tools.",
+        ]
+        batched = theme_extractor.extract_themes_batch(texts)
+
+        assert len(batched) == len(texts)
+        assert batched[1] == []
+        assert batched[0] == theme_extractor.extract_themes(texts[0])
+        assert batched[2] == theme_extractor.extract_themes(texts[2])
+
+    def test_count_term_matches_word_boundary_regex(self, theme_extractor):
+        """Test that precompiled keyword counting agrees with a plain \\b regex count."""
+        import re
+        from collections import Counter
+        from src.nlp.theme_extractor import _WORD_RE
+
+        text = ("AI-generated content, ai  ethics and AI ethics; re-AI-generated content. "
+                "Plagiarism, plagiarisms and data_protection vs data protection.").lower()
+        token_counts = Counter(_WORD_RE.findall(text))
+        for matchers in (theme_extractor._keyword_matchers, theme_extractor._pattern_matchers):
+            for entries in matchers.values():
+                for label, tokens, regex in entries:
+                    term = label.lower()
+                    expected = len(re.findall(r'\b' + re.escape(term) + r'\b', text))
+                    assert theme_extractor._count_term(tokens, regex, text, token_counts) == expected, term
@@ -0,0 +1,47 @@
+"""
+Test module for the batch analysis results template.
+
+Renders batch_results.html with the payload built by batch_analyse, using a
+minimal base layout so the test does not need the full application.
+"""
+
+import os
+
+import pytest
+from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemLoader
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'web', 'templates')
+
+
+@pytest.fixture
+def env():
+    environment = Environment(loader=ChoiceLoader([
+        DictLoader({'base.html': '{% block content %}{% endblock %}'}),
+        FileSystemLoader(TEMPLATE_DIR),
+    ]), autoescape=True)
+    environment.globals['url_for'] = lambda endpoint, **values: f"/{endpoint}/{values.get('filename', '')}"
+    return environment
+
+
+def test_batch_results_renders_each_result(env):
+    data = {
+        'analysis_date': '2025-01-01 12:00:00',
+        'summary': {
+            'total_files': 2, 'successful': 1, 'failed': 1, 'avg_confidence': 80.0,
+            'classification_summary': {'Moderate': 1},
+            'theme_summary': {'Academic Integrity': 1},
+        },
+        'results': [
+            {'status': 'success', 'filename': '7_20250101_oxford.pdf', 'original_filename': 'oxford.pdf',
+             'classification': {'classification': 'Moderate', 'confidence': 80},
+             'themes': [{'name': 'Academic Integrity'}]},
+            {'status': 'error', 'filename': '7_20250101_missing.pdf', 'original_filename': 'missing.pdf',
+             'error': 'File not found'},
+        ],
+    }
+    html = env.get_template('batch_results.html').render(data=data)
+
+    assert 'oxford.pdf' in html
+    assert '/analyse_document/7_20250101_oxford.pdf' in html
+    assert 'missing.pdf' in html and 'File not found' in html
+    assert 'Academic Integrity' in html
@@ -0,0 +1,55 @@
+"""
+Test module for the orjson-backed JSON provider.
+
+Checks that responses serialised through orjson match what Flask's default
+provider would produce for the payload shapes PolicyCraft returns.
+"""
+
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+from flask import Flask, jsonify
+
+from src.web.json_provider import OrjsonProvider, PolicyCraftJSONProvider, init_json_provider
+
+orjson = pytest.importorskip("orjson")
+
+
+class TestOrjsonProvider:
+    """Test suite for OrjsonProvider."""
+
+    @pytest.fixture
+    def apps(self):
+        default_app = Flask("default")
+        orjson_app = Flask("orjson")
+        assert init_json_provider(orjson_app)
+        return default_app, orjson_app
+
+    def test_provider_installed(self, apps):
+        _, orjson_app = apps
+        assert isinstance(orjson_app.json, OrjsonProvider)
+
+    def test_output_matches_default_provider(self, apps):
+        payload = {
+            "themes": [{"name": "Privacy", "score": 0.5}],
+            "classification": {"classification": "Moderate", "confidence": 80},
+            "analysis_date": datetime(2024, 1, 2, 3, 4, 5),
+        }
+        decoded = []
+        for app in apps:
+            with app.test_request_context():
+                decoded.append(app.json.loads(jsonify(payload).get_data()))
+        assert decoded[0] == decoded[1]
+
+    def test_unsupported_type_raises_type_error(self, apps):
+        _, orjson_app = apps
+        with orjson_app.app_context(), pytest.raises(TypeError):
+            orjson_app.json.dumps({"value": object()})
+
+    def test_object_id_serialised_as_string(self, apps):
+        _, orjson_app = apps
+        oid = ObjectId()
+        for provider in (orjson_app.json, PolicyCraftJSONProvider(orjson_app)):
+            with orjson_app.app_context():
+                assert provider.loads(provider.dumps({'_id': oid})) == {'_id': str(oid)}